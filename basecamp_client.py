@@ -1,9 +1,93 @@
 import os
 import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
 
 import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
+# Shared across all clients so consecutive API calls reuse pooled keep-alive
+# connections instead of paying a new TCP/TLS handshake every time. Cookies
+# are never stored: clients for different tokens share this session.
+_POOL_MAXSIZE = 20
+
+_session = requests.Session()
+_session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+# Enough pooled connections for the concurrent page and search fetches, and
+# retries with backoff for rate limiting and transient gateway errors. Only
+# idempotent methods are retried; the last response is returned, not raised.
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=_POOL_MAXSIZE,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 502, 503, 504),
+        raise_on_status=False,
+    ),
+))
+
+# Basecamp's geared pagination: page 1 has 15 results, page 2 has 30,
+# page 3 has 50, page 4+ has 100.
+_GEARED_PAGE_SIZES = (15, 30, 50)
+_MAX_PAGE_SIZE = 100
+
+# Upper bound on max_pages for fetch_pages, and how many pages it requests
+# at a time. Batches stay well inside the connection pool and Basecamp's
+# rate limit, and fetching stops at the first short page.
+MAX_FETCH_PAGES = 20
+_FETCH_BATCH_SIZE = min(4, _POOL_MAXSIZE)
+
+
+# Number of GET responses each client keeps for ETag revalidation
+_ETAG_CACHE_SIZE = 100
+
+
+def _not_modified_response(cached, not_modified):
+    """Rebuild the remembered 200 response for a 304 Not Modified.
+
+    Only the body, headers and encoding are remembered, so the cache holds
+    no connection or request state (including the Authorization header).
+    """
+    _, content, headers, encoding = cached
+    response = requests.Response()
+    response.status_code = 200
+    response._content = content
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = encoding
+    response.url = not_modified.url
+    response.request = not_modified.request
+    return response
+
+
+def _geared_page_size(page):
+    """Return the number of results a full page has for the given page number."""
+    if page <= len(_GEARED_PAGE_SIZES):
+        return _GEARED_PAGE_SIZES[page - 1]
+    return _MAX_PAGE_SIZE
+
+
+# Basecamp's 401 body for an expired token, matched without lowercasing it
+_EXPIRED_RE = re.compile("expired", re.IGNORECASE)
+
+
+class TokenExpiredError(Exception):
+    """Raised when Basecamp rejects a request because the OAuth token expired."""
+
+
+def _check_token_expired(response):
+    """Raise TokenExpiredError if the response is a 401 for an expired token."""
+    if response.status_code == 401:
+        challenge = response.headers.get("WWW-Authenticate", "")
+        if "invalid_token" in challenge or _EXPIRED_RE.search(response.text):
+            raise TokenExpiredError(f"{response.status_code} - {response.text}")
+    return response
+
 
 class BasecampClient:
     """
@@ -63,6 +147,10 @@ class BasecampClient:
         # Basecamp 3 uses a different URL structure
         self.base_url = f"https://3.basecampapi.com/{self.account_id}"
 
+        # (url, params) -> (etag, response) for conditional GETs, oldest first
+        self._etag_cache = OrderedDict()
+        self._etag_lock = threading.Lock()
+
     def test_connection(self):
         """Test the connection to Basecamp API."""
         response = self.get('projects.json')
@@ -72,29 +160,94 @@ class BasecampClient:
             return False, f"Connection failed: {response.status_code} - {response.text}"
 
     def get(self, endpoint, params=None):
-        """Make a GET request to the Basecamp API."""
+        """Make a GET request to the Basecamp API.
+
+        The body and headers of responses with an ETag are remembered.
+        Repeating the same request sends If-None-Match, and on 304 Not
+        Modified a response rebuilt from them is returned instead of
+        downloading the body again.
+        """
         url = f"{self.base_url}/{endpoint}"
-        return requests.get(url, auth=self.auth, headers=self.headers, params=params)
+        key = (url, tuple(sorted(params.items())) if params else None)
+        with self._etag_lock:
+            cached = self._etag_cache.get(key)
+
+        headers = self.headers
+        if cached is not None:
+            headers = {**self.headers, "If-None-Match": cached[0]}
+
+        response = _check_token_expired(
+            _session.get(url, auth=self.auth, headers=headers, params=params))
+
+        if response.status_code == 304 and cached is not None:
+            return _not_modified_response(cached, response)
+
+        etag = response.headers.get("ETag")
+        if response.status_code == 200 and etag:
+            with self._etag_lock:
+                self._etag_cache[key] = (etag, response.content, response.headers, response.encoding)
+                self._etag_cache.move_to_end(key)
+                if len(self._etag_cache) > _ETAG_CACHE_SIZE:
+                    self._etag_cache.popitem(last=False)
+        return response
 
     def post(self, endpoint, data=None):
         """Make a POST request to the Basecamp API."""
         url = f"{self.base_url}/{endpoint}"
-        return requests.post(url, auth=self.auth, headers=self.headers, json=data)
+        return _check_token_expired(
+            _session.post(url, auth=self.auth, headers=self.headers, json=data))
 
     def put(self, endpoint, data=None):
         """Make a PUT request to the Basecamp API."""
         url = f"{self.base_url}/{endpoint}"
-        return requests.put(url, auth=self.auth, headers=self.headers, json=data)
+        return _check_token_expired(
+            _session.put(url, auth=self.auth, headers=self.headers, json=data))
 
     def delete(self, endpoint):
         """Make a DELETE request to the Basecamp API."""
         url = f"{self.base_url}/{endpoint}"
-        return requests.delete(url, auth=self.auth, headers=self.headers)
+        return _check_token_expired(
+            _session.delete(url, auth=self.auth, headers=self.headers))
 
     def patch(self, endpoint, data=None):
         """Make a PATCH request to the Basecamp API."""
         url = f"{self.base_url}/{endpoint}"
-        return requests.patch(url, auth=self.auth, headers=self.headers, json=data)
+        return _check_token_expired(
+            _session.patch(url, auth=self.auth, headers=self.headers, json=data))
+
+    def fetch_pages(self, fetch_page, page=1, max_pages=5):
+        """Fetch consecutive pages of a paginated endpoint concurrently.
+
+        The first page is fetched on its own; if it is full, the following
+        pages up to max_pages are requested in parallel batches of
+        _FETCH_BATCH_SIZE and concatenated in page order, stopping at the
+        first page that isn't full.
+
+        Args:
+            fetch_page (callable): Called with a page number, returns that page's list
+            page (int, optional): First page to fetch (default: 1)
+            max_pages (int, optional): Maximum number of pages to fetch (default: 5,
+                at most MAX_FETCH_PAGES)
+
+        Returns:
+            list: Items from all fetched pages
+        """
+        items = fetch_page(page)
+        max_pages = min(max_pages, MAX_FETCH_PAGES)
+        if max_pages <= 1 or len(items) < _geared_page_size(page):
+            return items
+
+        next_page = page + 1
+        end = page + max_pages
+        with ThreadPoolExecutor(max_workers=min(_FETCH_BATCH_SIZE, max_pages - 1)) as executor:
+            while next_page < end:
+                batch = range(next_page, min(next_page + _FETCH_BATCH_SIZE, end))
+                for batch_page, page_items in zip(batch, executor.map(fetch_page, batch)):
+                    items.extend(page_items)
+                    if len(page_items) < _geared_page_size(batch_page):
+                        return items
+                next_page = batch.stop
+        return items
 
     # Project methods
     def get_projects(self):
@@ -1033,7 +1186,8 @@ class BasecampClient:
         headers["Content-Length"] = str(len(data))
 
         endpoint = f"attachments.json?name={name}"
-        response = requests.post(f"{self.base_url}/{endpoint}", auth=self.auth, headers=headers, data=data)
+        response = _check_token_expired(
+            _session.post(f"{self.base_url}/{endpoint}", auth=self.auth, headers=headers, data=data))
         if response.status_code == 201:
             return response.json()
         else:
@@ -6,6 +6,8 @@ This server implements the MCP (Model Context Protocol) using the official
 Anthropic FastMCP framework, replacing the custom JSON-RPC implementation.
 """
 
+import asyncio
+import functools
 import logging
 import os
 import sys
@@ -15,12 +17,12 @@ import httpx
 from mcp.server.fastmcp import FastMCP
 
 # Import existing business logic
-from basecamp_client import BasecampClient
+from basecamp_client import MAX_FETCH_PAGES, BasecampClient, TokenExpiredError
 from search_utils import BasecampSearch
 import token_storage
 import auth_manager
 from dotenv import load_dotenv
-from compact_response import compact_list
+from compact_response import compact_list, compact_lists, parse_fields
 
 # Determine project root (directory containing this script)
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
@@ -42,6 +44,9 @@ logger = logging.getLogger('basecamp_fastmcp')
 # Initialize FastMCP server
 mcp = FastMCP("basecamp")
 
+# (access_token, account_id, user_agent) and the client built for them
+_cached_client: Optional[tuple] = None
+
 # Auth helper functions (reused from original server)
 def _get_basecamp_client() -> Optional[BasecampClient]:
     """Get authenticated Basecamp client (sync version from original server)."""
@@ -69,34 +74,77 @@ def _get_basecamp_client() -> Optional[BasecampClient]:
             logger.error(f"Missing account_id. Token data: {token_data}, Env BASECAMP_ACCOUNT_ID: {os.getenv('BASECAMP_ACCOUNT_ID')}")
             return None
 
+        # Reuse the client while the token and account are unchanged
+        global _cached_client
+        key = (token_data['access_token'], account_id, user_agent)
+        if _cached_client is not None and _cached_client[0] == key:
+            return _cached_client[1]
+
         logger.debug(f"Creating Basecamp client with account_id: {account_id}, user_agent: {user_agent}")
 
-        return BasecampClient(
+        client = BasecampClient(
             access_token=token_data['access_token'],
             account_id=account_id,
             user_agent=user_agent,
             auth_mode='oauth'
         )
+        _cached_client = (key, client)
+        return client
     except Exception as e:
         logger.error(f"Error creating Basecamp client: {e}")
         return None
 
+# Fixed error responses, shared between calls. Returned as-is, so never mutate them.
+_AUTH_EXPIRED_RESPONSE = {
+    "error": "OAuth token expired",
+    "message": "Your Basecamp OAuth token has expired. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
+}
+_AUTH_REQUIRED_RESPONSE = {
+    "error": "Authentication required",
+    "message": "Please authenticate with Basecamp first. Visit http://localhost:8000 to log in."
+}
+_TOKEN_EXPIRED_RESPONSE = {
+    "error": "OAuth token expired",
+    "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
+}
+
 def _get_auth_error_response() -> Dict[str, Any]:
     """Return consistent auth error response."""
     if token_storage.is_token_expired():
-        return {
-            "error": "OAuth token expired",
-            "message": "Your Basecamp OAuth token has expired. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-        }
+        return _AUTH_EXPIRED_RESPONSE
     else:
-        return {
-            "error": "Authentication required", 
-            "message": "Please authenticate with Basecamp first. Visit http://localhost:8000 to log in."
-        }
+        return _AUTH_REQUIRED_RESPONSE
 
-async def _run_sync(func, *args, **kwargs):
-    """Wrapper to run synchronous functions in thread pool."""
-    return await anyio.to_thread.run_sync(func, *args, **kwargs)
+def _run_sync(func, *args, **kwargs):
+    """Run a synchronous function in the thread pool.
+
+    Returns anyio's awaitable directly rather than wrapping it in another
+    coroutine, so each tool call avoids an extra coroutine frame. anyio only
+    forwards positional arguments, so keyword arguments are bound up front.
+    """
+    if kwargs:
+        func = functools.partial(func, **kwargs)
+    return anyio.to_thread.run_sync(func, *args)
+
+# Identical client reads currently in flight, keyed by
+# (method name, account, token, args)
+_inflight_reads: Dict[tuple, asyncio.Future] = {}
+
+async def _run_sync_shared(func, *args):
+    """Run an idempotent client read, sharing it with identical in-flight calls.
+
+    Concurrent tool calls for the same resource and credentials await one
+    Basecamp request instead of each issuing their own, even when they got
+    different client objects.
+    """
+    client = func.__self__
+    key = (func.__name__, client.account_id, getattr(client, "access_token", client), args)
+    future = _inflight_reads.get(key)
+    if future is None:
+        future = asyncio.ensure_future(_run_sync(func, *args))
+        _inflight_reads[key] = future
+        future.add_done_callback(lambda _: _inflight_reads.pop(key, None))
+    return await asyncio.shield(future)
 
 # Core MCP Tools - Starting with essential ones from original server
 
@@ -120,13 +168,11 @@ async def get_projects(compact: bool = False) -> Dict[str, Any]:
             "projects": projects,
             "count": len(projects)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting projects: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting projects: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -149,13 +195,11 @@ async def get_project(project_id: str) -> Dict[str, Any]:
             "status": "success",
             "project": project
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting project {project_id}: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting project {project_id}: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -199,13 +243,11 @@ async def search_basecamp(query: str, project_id: Optional[str] = None, compact:
             "query": query,
             "results": results
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error searching Basecamp: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error searching Basecamp: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -232,13 +274,11 @@ async def get_todolists(project_id: str, compact: bool = False) -> Dict[str, Any
             "todolists": todolists,
             "count": len(todolists)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting todolists: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting todolists: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -266,13 +306,11 @@ async def get_todos(project_id: str, todolist_id: str, compact: bool = False) ->
             "todos": todos,
             "count": len(todos)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting todos: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting todos: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -296,13 +334,11 @@ async def get_todo(project_id: str, todo_id: str) -> Dict[str, Any]:
             "status": "success",
             "todo": todo
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting todo {todo_id}: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting todo {todo_id}: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -351,13 +387,11 @@ async def create_todo(project_id: str, todolist_id: str, content: str,
             "todo": todo,
             "message": f"Todo '{content}' created successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating todo: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating todo: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -415,13 +449,11 @@ async def update_todo(project_id: str, todo_id: str,
             "todo": todo,
             "message": "Todo updated successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error updating todo: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error updating todo: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -445,13 +477,11 @@ async def delete_todo(project_id: str, todo_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Todo deleted successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error deleting todo: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error deleting todo: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -476,13 +506,11 @@ async def complete_todo(project_id: str, todo_id: str) -> Dict[str, Any]:
             "completion": completion,
             "message": "Todo marked as complete"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error completing todo: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error completing todo: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -506,13 +534,11 @@ async def uncomplete_todo(project_id: str, todo_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Todo marked as incomplete"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error uncompleting todo: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error uncompleting todo: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -543,13 +569,11 @@ async def global_search(query: str, compact: bool = False) -> Dict[str, Any]:
             "query": query,
             "results": results
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error in global search: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error in global search: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -583,13 +607,11 @@ async def get_comments(recording_id: str, project_id: str, page: int = 1, compac
             "total_count": result["total_count"],
             "next_page": result["next_page"]
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting comments: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting comments: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -615,13 +637,11 @@ async def create_comment(recording_id: str, project_id: str, content: str) -> Di
             "comment": comment,
             "message": "Comment created successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating comment: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating comment: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again.",
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -649,13 +669,11 @@ async def get_campfire_lines(project_id: str, campfire_id: str, compact: bool =
             "campfire_lines": lines,
             "count": len(lines)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting campfire lines: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting campfire lines: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -678,13 +696,11 @@ async def get_message_board(project_id: str) -> Dict[str, Any]:
             "status": "success",
             "message_board": message_board
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting message board: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting message board: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -712,13 +728,11 @@ async def get_messages(project_id: str, message_board_id: Optional[str] = None,
             "messages": messages,
             "count": len(messages)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting messages: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting messages: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -742,13 +756,11 @@ async def get_message(project_id: str, message_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": message
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting message: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting message: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -773,13 +785,11 @@ async def get_inbox(project_id: str) -> Dict[str, Any]:
             "status": "success",
             "inbox": inbox
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting inbox: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting inbox: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -808,13 +818,11 @@ async def get_forwards(project_id: str, inbox_id: Optional[str] = None, compact:
             "forwards": forwards,
             "count": len(forwards)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting forwards: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting forwards: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -839,13 +847,11 @@ async def get_forward(project_id: str, forward_id: str) -> Dict[str, Any]:
             "status": "success",
             "forward": forward
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting forward: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting forward: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -874,13 +880,11 @@ async def get_inbox_replies(project_id: str, forward_id: str, compact: bool = Fa
             "replies": replies,
             "count": len(replies)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting inbox replies: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting inbox replies: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -906,13 +910,11 @@ async def get_inbox_reply(project_id: str, forward_id: str, reply_id: str) -> Di
             "status": "success",
             "reply": reply
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting inbox reply: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting inbox reply: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -937,13 +939,11 @@ async def trash_forward(project_id: str, forward_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Forward trashed"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error trashing forward: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error trashing forward: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -971,13 +971,11 @@ async def get_card_tables(project_id: str, compact: bool = False) -> Dict[str, A
             "card_tables": card_tables,
             "count": len(card_tables)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting card tables: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting card tables: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1001,14 +999,12 @@ async def get_card_table(project_id: str) -> Dict[str, Any]:
             "status": "success",
             "card_table": card_table_details
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting card table: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting card table: {e}")
         error_msg = str(e)
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "status": "error",
             "message": f"Error getting card table: {error_msg}",
@@ -1037,13 +1033,11 @@ async def get_columns(project_id: str, card_table_id: str, compact: bool = False
             "columns": columns,
             "count": len(columns)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting columns: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting columns: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1071,13 +1065,11 @@ async def get_cards(project_id: str, column_id: str, compact: bool = False) -> D
             "cards": cards,
             "count": len(cards)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting cards: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting cards: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1106,13 +1098,11 @@ async def create_card(project_id: str, column_id: str, title: str, content: Opti
             "card": card,
             "message": f"Card '{title}' created successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating card: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating card: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1136,13 +1126,11 @@ async def get_column(project_id: str, column_id: str) -> Dict[str, Any]:
             "status": "success",
             "column": column
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting column: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting column: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1168,13 +1156,11 @@ async def create_column(project_id: str, card_table_id: str, title: str) -> Dict
             "column": column,
             "message": f"Column '{title}' created successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating column: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating column: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1199,13 +1185,11 @@ async def move_card(project_id: str, card_id: str, column_id: str) -> Dict[str,
             "status": "success",
             "message": f"Card moved to column {column_id}"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error moving card: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error moving card: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1229,13 +1213,11 @@ async def complete_card(project_id: str, card_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Card marked as complete"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error completing card: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error completing card: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1259,13 +1241,11 @@ async def get_card(project_id: str, card_id: str) -> Dict[str, Any]:
             "status": "success",
             "card": card
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting card: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting card: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired", 
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1294,13 +1274,11 @@ async def update_card(project_id: str, card_id: str, title: Optional[str] = None
             "card": card,
             "message": "Card updated successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error updating card: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error updating card: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1330,13 +1308,11 @@ async def get_daily_check_ins(project_id: str, page: Optional[int] = None, compa
             "campfire_lines": answers,
             "count": len(answers)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting daily check ins: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting daily check ins: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1367,13 +1343,11 @@ async def get_question_answers(project_id: str, question_id: str, page: Optional
             "campfire_lines": answers,
             "count": len(answers)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting question answers: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting question answers: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1400,13 +1374,11 @@ async def update_column(project_id: str, column_id: str, title: str) -> Dict[str
             "column": column,
             "message": "Column updated successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error updating column: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error updating column: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1432,13 +1404,11 @@ async def move_column(project_id: str, card_table_id: str, column_id: str, posit
             "status": "success",
             "message": f"Column moved to position {position}"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error moving column: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error moving column: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1464,13 +1434,11 @@ async def update_column_color(project_id: str, column_id: str, color: str) -> Di
             "column": column,
             "message": f"Column color updated to {color}"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error updating column color: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error updating column color: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1494,13 +1462,11 @@ async def put_column_on_hold(project_id: str, column_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Column put on hold"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error putting column on hold: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error putting column on hold: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1524,13 +1490,11 @@ async def remove_column_hold(project_id: str, column_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Column hold removed"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error removing column hold: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error removing column hold: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1554,13 +1518,11 @@ async def watch_column(project_id: str, column_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Column notifications enabled"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error watching column: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error watching column: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1584,13 +1546,11 @@ async def unwatch_column(project_id: str, column_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Column notifications disabled"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error unwatching column: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error unwatching column: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1615,13 +1575,11 @@ async def uncomplete_card(project_id: str, card_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Card marked as incomplete"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error uncompleting card: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error uncompleting card: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1650,13 +1608,11 @@ async def get_card_steps(project_id: str, card_id: str, compact: bool = False) -
             "steps": steps,
             "count": len(steps)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting card steps: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting card steps: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1684,13 +1640,11 @@ async def create_card_step(project_id: str, card_id: str, title: str, due_on: Op
             "step": step,
             "message": f"Step '{title}' created successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating card step: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating card step: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1709,18 +1663,16 @@ async def get_card_step(project_id: str, step_id: str) -> Dict[str, Any]:
         return _get_auth_error_response()
     
     try:
-        step = await _run_sync(client.get_card_step, project_id, step_id)
+        step = await _run_sync_shared(client.get_card_step, project_id, step_id)
         return {
             "status": "success",
             "step": step
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting card step: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting card step: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1748,13 +1700,11 @@ async def update_card_step(project_id: str, step_id: str, title: Optional[str] =
             "step": step,
             "message": f"Step updated successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error updating card step: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error updating card step: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1778,13 +1728,11 @@ async def delete_card_step(project_id: str, step_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Step deleted successfully"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error deleting card step: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error deleting card step: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1808,13 +1756,11 @@ async def complete_card_step(project_id: str, step_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Step marked as complete"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error completing card step: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error completing card step: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1838,13 +1784,11 @@ async def uncomplete_card_step(project_id: str, step_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Step marked as incomplete"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error uncompleting card step: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error uncompleting card step: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1870,20 +1814,19 @@ async def create_attachment(file_path: str, name: str, content_type: Optional[st
             "status": "success",
             "attachment": result
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating attachment: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating attachment: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
         }
 
 @mcp.tool()
-async def get_events(project_id: str, recording_id: str, page: int = 1, compact: bool = False) -> Dict[str, Any]:
+async def get_events(project_id: str, recording_id: str, page: int = 1, compact: bool = False,
+                     auto_paginate: bool = False, max_pages: int = 5) -> Dict[str, Any]:
     """Get events for a recording.
 
     Args:
@@ -1892,13 +1835,23 @@ async def get_events(project_id: str, recording_id: str, page: int = 1, compact:
         page: Page number for pagination (default: 1). Basecamp uses geared pagination:
               page 1 has 15 results, page 2 has 30, page 3 has 50, page 4+ has 100.
         compact: If True, return only essential fields (id, action, created_at)
+        auto_paginate: If True, fetch up to max_pages pages starting at page, in parallel
+        max_pages: Maximum number of pages to fetch when auto_paginate is True
+                   (default: 5, at most 20)
     """
     client = _get_basecamp_client()
     if not client:
         return _get_auth_error_response()
 
     try:
-        events = await _run_sync(client.get_events, project_id, recording_id, page)
+        if auto_paginate:
+            events = await _run_sync(
+                client.fetch_pages,
+                lambda p: client.get_events(project_id, recording_id, p),
+                page, min(max_pages, MAX_FETCH_PAGES)
+            )
+        else:
+            events = await _run_sync(client.get_events, project_id, recording_id, page)
         if compact:
             events = compact_list(events, "event")
         return {
@@ -1906,20 +1859,19 @@ async def get_events(project_id: str, recording_id: str, page: int = 1, compact:
             "events": events,
             "count": len(events)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting events: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting events: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
         }
 
 @mcp.tool()
-async def get_recordings(type: str, bucket: Optional[str] = None, status: str = "active", sort: str = "created_at", direction: str = "desc", page: int = 1, compact: bool = False) -> Dict[str, Any]:
+async def get_recordings(type: str, bucket: Optional[str] = None, status: str = "active", sort: str = "created_at", direction: str = "desc", page: int = 1, compact: bool = False,
+                         auto_paginate: bool = False, max_pages: int = 5) -> Dict[str, Any]:
     """Get recordings of a specific type across projects (global activity feed).
 
     Use this to browse recent activity across all projects or within specific ones.
@@ -1936,13 +1888,23 @@ async def get_recordings(type: str, bucket: Optional[str] = None, status: str =
         direction: Sort direction: desc or asc (default: desc)
         page: Page number for pagination (default: 1)
         compact: If True, return only essential fields (id, title, type, created_at, url)
+        auto_paginate: If True, fetch up to max_pages pages starting at page, in parallel
+        max_pages: Maximum number of pages to fetch when auto_paginate is True
+                   (default: 5, at most 20)
     """
     client = _get_basecamp_client()
     if not client:
         return _get_auth_error_response()
 
     try:
-        recordings = await _run_sync(client.get_recordings, type, bucket, status, sort, direction, page)
+        if auto_paginate:
+            recordings = await _run_sync(
+                client.fetch_pages,
+                lambda p: client.get_recordings(type, bucket, status, sort, direction, p),
+                page, min(max_pages, MAX_FETCH_PAGES)
+            )
+        else:
+            recordings = await _run_sync(client.get_recordings, type, bucket, status, sort, direction, page)
         if compact:
             recordings = compact_list(recordings, "recording")
         return {
@@ -1950,13 +1912,11 @@ async def get_recordings(type: str, bucket: Optional[str] = None, status: str =
             "recordings": recordings,
             "count": len(recordings)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting recordings: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting recordings: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -1975,7 +1935,7 @@ async def get_webhooks(project_id: str, compact: bool = False) -> Dict[str, Any]
         return _get_auth_error_response()
     
     try:
-        hooks = await _run_sync(client.get_webhooks, project_id)
+        hooks = await _run_sync_shared(client.get_webhooks, project_id)
         if compact:
             hooks = compact_list(hooks, "webhook")
         return {
@@ -1983,13 +1943,11 @@ async def get_webhooks(project_id: str, compact: bool = False) -> Dict[str, Any]
             "webhooks": hooks,
             "count": len(hooks)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting webhooks: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting webhooks: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2014,13 +1972,11 @@ async def create_webhook(project_id: str, payload_url: str, types: Optional[List
             "status": "success",
             "webhook": hook
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating webhook: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating webhook: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2044,13 +2000,11 @@ async def delete_webhook(project_id: str, webhook_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Webhook deleted"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error deleting webhook: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error deleting webhook: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2071,7 +2025,7 @@ async def get_documents(project_id: str, vault_id: str, compact: bool = False) -
         return _get_auth_error_response()
     
     try:
-        docs = await _run_sync(client.get_documents, project_id, vault_id)
+        docs = await _run_sync_shared(client.get_documents, project_id, vault_id)
         if compact:
             docs = compact_list(docs, "document")
         return {
@@ -2079,13 +2033,11 @@ async def get_documents(project_id: str, vault_id: str, compact: bool = False) -
             "documents": docs,
             "count": len(docs)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting documents: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting documents: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2104,18 +2056,16 @@ async def get_document(project_id: str, document_id: str) -> Dict[str, Any]:
         return _get_auth_error_response()
     
     try:
-        doc = await _run_sync(client.get_document, project_id, document_id)
+        doc = await _run_sync_shared(client.get_document, project_id, document_id)
         return {
             "status": "success",
             "document": doc
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting document: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting document: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2141,13 +2091,11 @@ async def create_document(project_id: str, vault_id: str, title: str, content: s
             "status": "success",
             "document": doc
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error creating document: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error creating document: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2173,13 +2121,11 @@ async def update_document(project_id: str, document_id: str, title: Optional[str
             "status": "success",
             "document": doc
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error updating document: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error updating document: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2203,13 +2149,11 @@ async def trash_document(project_id: str, document_id: str) -> Dict[str, Any]:
             "status": "success",
             "message": "Document trashed"
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error trashing document: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error trashing document: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2238,13 +2182,11 @@ async def get_uploads(project_id: str, vault_id: Optional[str] = None, compact:
             "uploads": uploads,
             "count": len(uploads)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting uploads: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting uploads: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2263,18 +2205,16 @@ async def get_upload(project_id: str, upload_id: str) -> Dict[str, Any]:
         return _get_auth_error_response()
     
     try:
-        upload = await _run_sync(client.get_upload, project_id, upload_id)
+        upload = await _run_sync_shared(client.get_upload, project_id, upload_id)
         return {
             "status": "success",
             "upload": upload
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting upload: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting upload: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2282,7 +2222,8 @@ async def get_upload(project_id: str, upload_id: str) -> Dict[str, Any]:
 
 # Timeline Tools
 @mcp.tool()
-async def get_timeline(page: int = 1, compact: bool = False) -> Dict[str, Any]:
+async def get_timeline(page: int = 1, compact: bool = False,
+                       auto_paginate: bool = False, max_pages: int = 5) -> Dict[str, Any]:
     """Get timeline events across all projects (global activity feed).
 
     Shows recent activity like messages posted, to-dos completed, files uploaded, etc.
@@ -2290,13 +2231,20 @@ async def get_timeline(page: int = 1, compact: bool = False) -> Dict[str, Any]:
     Args:
         page: Page number for pagination (default: 1)
         compact: If True, return only essential fields (id, action, created_at)
+        auto_paginate: If True, fetch up to max_pages pages starting at page, in parallel
+        max_pages: Maximum number of pages to fetch when auto_paginate is True
+                   (default: 5, at most 20)
     """
     client = _get_basecamp_client()
     if not client:
         return _get_auth_error_response()
 
     try:
-        events = await _run_sync(client.get_timeline, page)
+        if auto_paginate:
+            events = await _run_sync(client.fetch_pages, client.get_timeline, page,
+                                     min(max_pages, MAX_FETCH_PAGES))
+        else:
+            events = await _run_sync(client.get_timeline, page)
         if compact:
             events = compact_list(events, "event")
         return {
@@ -2305,13 +2253,11 @@ async def get_timeline(page: int = 1, compact: bool = False) -> Dict[str, Any]:
             "count": len(events),
             "page": page
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting timeline: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting timeline: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2340,13 +2286,11 @@ async def get_project_timeline(project_id: str, page: int = 1, compact: bool = F
             "count": len(events),
             "page": page
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting project timeline: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting project timeline: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2367,23 +2311,21 @@ async def get_person_timeline(person_id: str, page: int = 1, compact: bool = Fal
 
     try:
         result = await _run_sync(client.get_person_timeline, person_id, page)
-        events = result.get("events", [])
+        events = result.get("events") or []
         if compact:
             events = compact_list(events, "event")
         return {
             "status": "success",
             "person": result.get("person"),
             "events": events,
-            "count": len(result.get("events", [])),
+            "count": len(events),
             "page": page
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting person timeline: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting person timeline: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2398,19 +2340,17 @@ async def get_todo_assignees() -> Dict[str, Any]:
         return _get_auth_error_response()
 
     try:
-        people = await _run_sync(client.get_todo_assignees)
+        people = await _run_sync_shared(client.get_todo_assignees)
         return {
             "status": "success",
             "people": people,
             "count": len(people)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting todo assignees: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting todo assignees: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2431,7 +2371,7 @@ async def get_person_todos(person_id: str, group_by: str = "bucket", compact: bo
 
     try:
         result = await _run_sync(client.get_person_todos, person_id, group_by)
-        todos = result.get("todos", [])
+        todos = result.get("todos") or []
         if compact:
             todos = compact_list(todos, "todo")
         return {
@@ -2439,15 +2379,13 @@ async def get_person_todos(person_id: str, group_by: str = "bucket", compact: bo
             "person": result.get("person"),
             "grouped_by": result.get("grouped_by"),
             "todos": todos,
-            "count": len(result.get("todos", []))
+            "count": len(todos)
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting person todos: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting person todos: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
@@ -2476,27 +2414,28 @@ async def get_overdue_todos(compact: bool = False) -> Dict[str, Any]:
             "status": "success",
             "overdue_todos": result
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting overdue todos: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting overdue todos: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
         }
 
 @mcp.tool()
-async def get_upcoming_schedule(window_starts_on: str, window_ends_on: str, compact: bool = False) -> Dict[str, Any]:
+async def get_upcoming_schedule(window_starts_on: str, window_ends_on: str, compact: bool = False,
+                                fields: Optional[str] = None) -> Dict[str, Any]:
     """Get schedule entries and assignable items within a date window.
 
     Args:
         window_starts_on: Start date in YYYY-MM-DD format
         window_ends_on: End date in YYYY-MM-DD format
         compact: If True, return only essential fields (id, title, type, created_at, url)
+        fields: Comma-separated subset of the compact fields to return (e.g. "id,title"). Implies compact.
     """
+    only = parse_fields(fields)
     client = _get_basecamp_client()
     if not client:
         return _get_auth_error_response()
@@ -2508,23 +2447,21 @@ async def get_upcoming_schedule(window_starts_on: str, window_ends_on: str, comp
         schedule_entries = result.get("schedule_entries", [])
         recurring = result.get("recurring_schedule_entry_occurrences", [])
         assignables = result.get("assignables", [])
-        if compact:
-            schedule_entries = compact_list(schedule_entries, "recording")
-            recurring = compact_list(recurring, "recording")
-            assignables = compact_list(assignables, "recording")
+        if compact or only is not None:
+            schedule_entries, recurring, assignables = compact_lists(
+                (schedule_entries, recurring, assignables), "recording", only
+            )
         return {
             "status": "success",
             "schedule_entries": schedule_entries,
             "recurring_schedule_entry_occurrences": recurring,
             "assignables": assignables
         }
+    except TokenExpiredError as e:
+        logger.error(f"Error getting upcoming schedule: {e}")
+        return _TOKEN_EXPIRED_RESPONSE
     except Exception as e:
         logger.error(f"Error getting upcoming schedule: {e}")
-        if "401" in str(e) and "expired" in str(e).lower():
-            return {
-                "error": "OAuth token expired",
-                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-            }
         return {
             "error": "Execution error",
             "message": str(e)
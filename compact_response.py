@@ -12,112 +12,205 @@ Usage:
         cards = compact_list(cards, "card")
 """
 
-from typing import Any, Dict, List, Optional
+import functools
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional
 
 
 # Fields to keep for each resource type in compact mode
 COMPACT_FIELDS = {
-    "project":       ["id", "name", "description", "app_url"],
-    "todo":          ["id", "title", "completed", "due_on", "app_url"],
-    "todolist":      ["id", "title", "completed", "app_url"],
-    "card":          ["id", "title", "completed", "due_on", "app_url"],
-    "column":        ["id", "title", "cards_count"],
-    "step":          ["id", "title", "completed", "due_on"],
-    "message":       ["id", "subject", "created_at", "app_url"],
-    "comment":       ["id", "created_at", "app_url"],
-    "forward":       ["id", "subject", "created_at", "app_url"],
-    "reply":         ["id", "created_at", "app_url"],
-    "document":      ["id", "title", "created_at", "app_url"],
-    "upload":        ["id", "title", "filename", "created_at", "app_url"],
-    "campfire_line": ["id", "created_at"],
-    "event":         ["id", "action", "created_at"],
-    "recording":     ["id", "title", "type", "created_at", "app_url"],
-    "webhook":       ["id", "payload_url", "active"],
-    "card_table":    ["id", "title"],
+    "project":       ("id", "name", "description", "app_url"),
+    "todo":          ("id", "title", "completed", "due_on", "app_url"),
+    "todolist":      ("id", "title", "completed", "app_url"),
+    "card":          ("id", "title", "completed", "due_on", "app_url"),
+    "column":        ("id", "title", "cards_count"),
+    "step":          ("id", "title", "completed", "due_on"),
+    "message":       ("id", "subject", "created_at", "app_url"),
+    "comment":       ("id", "created_at", "app_url"),
+    "forward":       ("id", "subject", "created_at", "app_url"),
+    "reply":         ("id", "created_at", "app_url"),
+    "document":      ("id", "title", "created_at", "app_url"),
+    "upload":        ("id", "title", "filename", "created_at", "app_url"),
+    "campfire_line": ("id", "created_at"),
+    "event":         ("id", "action", "created_at"),
+    "recording":     ("id", "title", "type", "created_at", "app_url"),
+    "webhook":       ("id", "payload_url", "active"),
+    "card_table":    ("id", "title"),
 }
 
 # Resource types that should include assignee names
-_ASSIGNEE_TYPES = {"todo", "card", "step"}
+_ASSIGNEE_TYPES = frozenset({"todo", "card", "step"})
 
 # Resource types that should include creator name
-_CREATOR_TYPES = {"message", "comment", "forward", "reply", "document", "upload"}
+_CREATOR_TYPES = frozenset({"message", "comment", "forward", "reply", "document", "upload"})
 
 # Resource types that should include truncated content
-_CONTENT_TYPES = {"comment", "campfire_line"}
+_CONTENT_TYPES = frozenset({"comment", "campfire_line"})
 
 _CONTENT_MAX_LENGTH = 200
 
 
-def _extract_assignee_names(item: Dict[str, Any]) -> List[str]:
-    """Extract assignee names from nested assignees/assignee fields."""
-    names = []
-    assignees = item.get("assignees")
-    if isinstance(assignees, list):
-        for assignee in assignees:
-            if isinstance(assignee, dict) and "name" in assignee:
-                names.append(assignee["name"])
-    return names
+def _make_compactor(resource_type: str,
+                    only: Optional[FrozenSet[str]] = None) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Build the projection function for one resource type.
 
-
-def _extract_creator_name(item: Dict[str, Any]) -> Optional[str]:
-    """Extract creator name from nested creator field."""
-    creator = item.get("creator")
-    if isinstance(creator, dict):
-        return creator.get("name")
-    return None
+    The field list and extension flags are resolved once here instead of on
+    every item. If only is given, the projection is narrowed to those of the
+    compact fields (including assignee_names, creator_name and content).
+    """
+    fields = COMPACT_FIELDS.get(resource_type, ())
+    with_assignees = resource_type in _ASSIGNEE_TYPES
+    with_creator = resource_type in _CREATOR_TYPES
+    with_content = resource_type in _CONTENT_TYPES
+    if only is not None:
+        fields = tuple(field for field in fields if field in only)
+        with_assignees = with_assignees and "assignee_names" in only
+        with_creator = with_creator and "creator_name" in only
+        with_content = with_content and "content" in only
+
+    def compact(item: Dict[str, Any]) -> Dict[str, Any]:
+        # Keys come from the field tuple, not the decoded JSON, so every
+        # compacted dict shares the same (compiler-interned) key strings.
+        result = {}
+        for field in fields:
+            if field in item:
+                result[field] = item[field]
+
+        # Extensions are inlined rather than split into helper functions to
+        # save two function calls per item.
+        if with_assignees:
+            assignees = item.get("assignees")
+            if assignees and isinstance(assignees, list):
+                names = [a["name"] for a in assignees if isinstance(a, dict) and "name" in a]
+                if names:
+                    result["assignee_names"] = names
+
+        if with_creator:
+            creator = item.get("creator")
+            if isinstance(creator, dict):
+                name = creator.get("name")
+                if name:
+                    result["creator_name"] = name
+
+        if with_content:
+            content = item.get("content")
+            if isinstance(content, str):
+                result["content"] = (f"{content[:_CONTENT_MAX_LENGTH]}..."
+                                     if len(content) > _CONTENT_MAX_LENGTH else content)
+
+        return result
+
+    return compact
+
+
+def _compact_unknown(item: Dict[str, Any]) -> Dict[str, Any]:
+    """Projection for resource types without an entry in COMPACT_FIELDS."""
+    return {}
+
+
+# One projection function per resource type, built at import time
+_COMPACTORS = {resource_type: _make_compactor(resource_type) for resource_type in COMPACT_FIELDS}
+
+
+@functools.lru_cache(maxsize=128)
+def _narrowed_compactor(resource_type: str, fields: FrozenSet[str]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Projection function for a client-selected subset of the compact fields."""
+    if resource_type not in COMPACT_FIELDS:
+        return _compact_unknown
+    return _make_compactor(resource_type, fields)
+
+
+def _get_compactor(resource_type: str, fields: Optional[FrozenSet[str]]) -> Callable[[Dict[str, Any]], Dict[str, Any]]:
+    """Projection function for a resource type and optional field subset."""
+    if fields is None:
+        return _COMPACTORS.get(resource_type, _compact_unknown)
+    return _narrowed_compactor(resource_type, fields)
+
+
+def parse_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Parse a comma-separated field list from a tool argument.
+
+    Returns None when no fields were requested, so the default compact
+    fields apply.
+    """
+    if not fields:
+        return None
+    return frozenset(field.strip() for field in fields.split(",") if field.strip())
 
 
-def compact_item(item: Dict[str, Any], resource_type: str) -> Dict[str, Any]:
+def compact_item(item: Dict[str, Any], resource_type: str,
+                 fields: Optional[FrozenSet[str]] = None) -> Dict[str, Any]:
     """Filter a single item to only compact fields.
 
     Args:
         item: Full API response item
         resource_type: Key into COMPACT_FIELDS (e.g. "card", "todo")
+        fields: Optional subset of the compact fields to keep (see parse_fields)
 
     Returns:
         Dict with only the essential fields
     """
     if not isinstance(item, dict):
         return item
+    return _get_compactor(resource_type, fields)(item)
 
-    fields = COMPACT_FIELDS.get(resource_type, [])
-    result = {}
-
-    for field in fields:
-        if field in item:
-            result[field] = item[field]
-
-    if resource_type in _ASSIGNEE_TYPES:
-        names = _extract_assignee_names(item)
-        if names:
-            result["assignee_names"] = names
-
-    if resource_type in _CREATOR_TYPES:
-        name = _extract_creator_name(item)
-        if name:
-            result["creator_name"] = name
-
-    if resource_type in _CONTENT_TYPES:
-        content = item.get("content")
-        if isinstance(content, str):
-            if len(content) > _CONTENT_MAX_LENGTH:
-                result["content"] = content[:_CONTENT_MAX_LENGTH] + "..."
-            else:
-                result["content"] = content
 
-    return result
-
-
-def compact_list(items: List[Any], resource_type: str) -> List[Dict[str, Any]]:
+def compact_list(items: List[Any], resource_type: str,
+                 fields: Optional[FrozenSet[str]] = None) -> List[Dict[str, Any]]:
     """Filter a list of items to only compact fields.
 
     Args:
         items: List of full API response items
         resource_type: Key into COMPACT_FIELDS
+        fields: Optional subset of the compact fields to keep (see parse_fields)
 
     Returns:
         List of filtered items
     """
     if not isinstance(items, list):
         return items
-    return [compact_item(item, resource_type) for item in items]
+    compact = _get_compactor(resource_type, fields)
+    return [compact(item) if isinstance(item, dict) else item for item in items]
+
+
+def compact_lists(items_lists: Iterable[Any], resource_type: str,
+                  fields: Optional[FrozenSet[str]] = None) -> List[Any]:
+    """Filter several lists of the same resource type to only compact fields.
+
+    Equivalent to calling compact_list on each list, but resolves the
+    compactor once for all of them.
+
+    Args:
+        items_lists: Lists of full API response items
+        resource_type: Key into COMPACT_FIELDS
+        fields: Optional subset of the compact fields to keep (see parse_fields)
+
+    Returns:
+        One filtered list per input list, in the same order
+    """
+    compact = _get_compactor(resource_type, fields)
+    return [
+        [compact(item) if isinstance(item, dict) else item for item in items]
+        if isinstance(items, list) else items
+        for items in items_lists
+    ]
+
+
+def compact_iter(items: Iterable[Any], resource_type: str,
+                 fields: Optional[FrozenSet[str]] = None) -> Iterator[Dict[str, Any]]:
+    """Lazily filter items to only compact fields.
+
+    Like compact_list, but yields one compacted item at a time so a streaming
+    writer never holds the whole compacted list in memory. Tool responses that
+    are returned as dicts still need compact_list.
+
+    Args:
+        items: Iterable of full API response items
+        resource_type: Key into COMPACT_FIELDS
+        fields: Optional subset of the compact fields to keep (see parse_fields)
+
+    Yields:
+        Filtered items
+    """
+    compact = _get_compactor(resource_type, fields)
+    for item in items:
+        yield compact(item) if isinstance(item, dict) else item
@@ -6,844 +6,2094 @@ This server implements the MCP (Model Context Protocol) via stdin/stdout
 as expected by Cursor.
 """
 
+from __future__ import annotations
+
+import importlib
 import json
 import sys
 import logging
-from typing import Any, Dict, List, Optional
-from basecamp_client import BasecampClient
-from search_utils import BasecampSearch
-import token_storage
-import auth_manager
 import os
-from dotenv import load_dotenv
+import time
+
+# Annotations are not evaluated at runtime (PEP 563), so they use builtin
+# generics and the names below are only imported for type checkers. Type
+# checkers treat a module-level TYPE_CHECKING as true; defining it here
+# keeps typing itself off the startup path.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+    from typing import Any
+
+    from basecamp_client import BasecampClient
+    from search_utils import BasecampSearch
+
+try:
+    import orjson  # Optional: faster encoding/decoding of the JSON-RPC stream
+except ImportError:
+    orjson = None
+
+# String values accepted as true for boolean arguments and settings
+_TRUTHY = frozenset({"1", "true", "yes", "on"})
+
+
+def _parse_bool(value: str) -> bool:
+    return value.strip().lower() in _TRUTHY
+
+
+# Tool results are sent compact; MCP_PRETTY=1 indents them for reading by hand
+_PRETTY = _parse_bool(os.environ.get('MCP_PRETTY', ''))
+
+# _loads accepts bytes; _dumpb returns UTF-8 encoded JSON bytes; _dumps_text
+# returns the JSON text embedded in tool results
+if orjson is not None:
+    _loads = orjson.loads
+    _text_options = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if _PRETTY else 0)
+
+    def _dumpb(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    def _dumps_text(obj: Any) -> str:
+        return orjson.dumps(obj, option=_text_options).decode()
+else:
+    _loads = json.loads
+
+    # Same output shape as orjson: no whitespace, non-ASCII left unescaped
+    _encoder = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+    _text_encoder = json.JSONEncoder(ensure_ascii=False, indent=2) if _PRETTY else _encoder
+
+    def _dumpb(obj: Any) -> bytes:
+        return _encoder.encode(obj).encode()
+
+    def _dumps_text(obj: Any) -> str:
+        return _text_encoder.encode(obj)
+
+SERVER_NAME = "basecamp-mcp-server"
+SERVER_VERSION = "1.0.0"
+
+USAGE = f"""usage: mcp_server_cli.py [--help] [--version]
+
+{SERVER_NAME} {SERVER_VERSION}: Basecamp MCP server speaking JSON-RPC over stdin/stdout.
+Started without arguments by the MCP client (e.g. Cursor).
+"""
 
 # Determine project root (directory containing this script)
 PROJECT_ROOT = os.path.dirname(os.path.abspath(__file__))
-# Explicitly load .env from the project root
 DOTENV_PATH = os.path.join(PROJECT_ROOT, '.env')
-load_dotenv(DOTENV_PATH)
+
+# The Basecamp client, search and auth modules pull in requests and friends.
+# They are imported on first use so that starting the server and answering
+# initialize/tools/list doesn't pay for them.
+_LAZY_ATTRIBUTES = {
+    "BasecampClient": ("basecamp_client", "BasecampClient"),
+    "BasecampSearch": ("search_utils", "BasecampSearch"),
+    "token_storage": ("token_storage", None),
+    "auth_manager": ("auth_manager", None),
+}
+
+
+def __getattr__(name):
+    """Import the lazily loaded names on first attribute access."""
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = importlib.import_module(module_name)
+    value = getattr(module, attribute) if attribute else module
+    globals()[name] = value
+    return value
+
+
+def _lazy(name):
+    """Return one of the _LAZY_ATTRIBUTES, importing it on first use.
+
+    Code in this module uses this rather than a local import so that
+    patching mcp_server_cli.<name> also replaces what the server uses.
+    """
+    try:
+        return globals()[name]
+    except KeyError:
+        return __getattr__(name)
+
+
+_env_loaded = False
+# Settings read from the environment by _load_env_once()
+_env_account_id: str | None = None
+_user_agent: str | None = None
+
+# Seconds a client is reused without re-reading the token or re-checking expiry
+_CLIENT_TTL = 60.0
+
+# Seconds a read-only tool result is served from memory, and how many are kept
+_RESPONSE_TTL = 30.0
+_RESPONSE_CACHE_SIZE = 512
+
+
+def _load_env_once():
+    """Explicitly load .env from the project root, the first time auth is needed.
+
+    The settings the server reads are snapshotted at the same time, so tool
+    calls don't look them up again.
+    """
+    global _env_loaded, _env_account_id, _user_agent
+    if not _env_loaded:
+        from dotenv import load_dotenv
+        load_dotenv(DOTENV_PATH)
+        _env_account_id = os.getenv('BASECAMP_ACCOUNT_ID')
+        # Set a default user agent if none is provided
+        _user_agent = os.getenv('USER_AGENT') or "Basecamp MCP Server (cursor@example.com)"
+        _env_loaded = True
 
 # Log file in the project directory
 LOG_FILE_PATH = os.path.join(PROJECT_ROOT, 'mcp_cli_server.log')
-# Set up logging to file AND stderr
+# Log level from MCP_LOG (e.g. MCP_LOG=debug). Warnings and errors go to stderr
+# by default; the log file is only written when debug logging is requested.
+LOG_LEVEL = getattr(logging, os.environ.get('MCP_LOG', 'WARNING').upper(), None)
+if not isinstance(LOG_LEVEL, int):
+    LOG_LEVEL = logging.WARNING
+_log_handlers = [logging.StreamHandler(sys.stderr)]
+if LOG_LEVEL <= logging.DEBUG:
+    # Debug logging writes several lines per request. Records are queued and
+    # written to stderr and the log file by a background thread, so the stdio
+    # loop never waits on that I/O. The QueueHandler formats each record, so
+    # the listener's handlers keep the default message-only format.
+    import atexit
+    import logging.handlers
+    import queue
+
+    _log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(
+        _log_queue, logging.StreamHandler(sys.stderr), logging.FileHandler(LOG_FILE_PATH)
+    )
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+    _log_handlers = [logging.handlers.QueueHandler(_log_queue)]
 logging.basicConfig(
-    level=logging.DEBUG,
+    level=LOG_LEVEL,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler(LOG_FILE_PATH),
-        logging.StreamHandler(sys.stderr)  # Added StreamHandler for stderr
-    ]
+    handlers=_log_handlers
 )
 logger = logging.getLogger('mcp_cli_server')
 
-class MCPServer:
-    """MCP server implementing the Model Context Protocol for Cursor."""
-
-    def __init__(self):
-        self.tools = self._get_available_tools()
-        logger.info("MCP CLI Server initialized")
-
-    def _get_available_tools(self) -> List[Dict[str, Any]]:
-        """Get list of available tools for Basecamp."""
-        return [
-            {
-                "name": "get_projects",
-                "description": "Get all Basecamp projects",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
+# Schema properties shared by many tools; the dicts are reused by reference
+_PROJECT_ID_PROP = {"type": "string", "description": "The project ID"}
+_COLUMN_ID_PROP = {"type": "string", "description": "The column ID"}
+_CARD_ID_PROP = {"type": "string", "description": "The card ID"}
+_STEP_ID_PROP = {"type": "string", "description": "The step ID"}
+_TODO_ID_PROP = {"type": "string", "description": "The todo ID"}
+_CARD_TABLE_ID_PROP = {"type": "string", "description": "The card table ID"}
+_TODOLIST_ID_PROP = {"type": "string", "description": "The todo list ID"}
+_PERSON_ID_PROP = {"type": "string", "description": "The person ID"}
+_PAGE_PROP = {"type": "integer", "description": "Page number for pagination (default: 1)", "default": 1}
+_AUTO_PAGINATE_PROP = {"type": "boolean", "description": "If true, fetch up to max_pages pages starting at page, in parallel", "default": False}
+_MAX_PAGES_PROP = {"type": "integer", "description": "Maximum number of pages to fetch when auto_paginate is true (default: 5, at most 20)", "default": 5, "minimum": 1, "maximum": 20}
+
+# Static tool schemas, built once at import and shared by every MCPServer
+_TOOLS = (
+    {
+        "name": "get_projects",
+        "description": "Get all Basecamp projects",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    {
+        "name": "get_project",
+        "description": "Get details for a specific project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP
             },
-            {
-                "name": "get_project",
-                "description": "Get details for a specific project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"}
-                    },
-                    "required": ["project_id"]
-                }
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "get_todolists",
+        "description": "Get todo lists for a project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP
             },
-            {
-                "name": "get_todolists",
-                "description": "Get todo lists for a project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"}
-                    },
-                    "required": ["project_id"]
-                }
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "get_todos",
+        "description": "Get todos from a todo list",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "todolist_id": _TODOLIST_ID_PROP,
             },
-            {
-                "name": "get_todos",
-                "description": "Get todos from a todo list",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "todolist_id": {"type": "string", "description": "The todo list ID"},
-                    },
-                    "required": ["project_id", "todolist_id"]
-                }
+            "required": ["project_id", "todolist_id"]
+        }
+    },
+    {
+        "name": "create_todo",
+        "description": "Create a new todo item in a todo list",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "todolist_id": _TODOLIST_ID_PROP,
+                "content": {"type": "string", "description": "The todo item's text (required)"},
+                "description": {"type": "string", "description": "HTML description of the todo"},
+                "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to assign"},
+                "completion_subscriber_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to notify on completion"},
+                "notify": {"type": "boolean", "description": "Whether to notify assignees"},
+                "due_on": {"type": "string", "description": "Due date in YYYY-MM-DD format"},
+                "starts_on": {"type": "string", "description": "Start date in YYYY-MM-DD format"}
             },
-            {
-                "name": "create_todo",
-                "description": "Create a new todo item in a todo list",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "todolist_id": {"type": "string", "description": "The todo list ID"},
-                        "content": {"type": "string", "description": "The todo item's text (required)"},
-                        "description": {"type": "string", "description": "HTML description of the todo"},
-                        "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to assign"},
-                        "completion_subscriber_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to notify on completion"},
-                        "notify": {"type": "boolean", "description": "Whether to notify assignees"},
-                        "due_on": {"type": "string", "description": "Due date in YYYY-MM-DD format"},
-                        "starts_on": {"type": "string", "description": "Start date in YYYY-MM-DD format"}
-                    },
-                    "required": ["project_id", "todolist_id", "content"]
-                }
+            "required": ["project_id", "todolist_id", "content"]
+        }
+    },
+    {
+        "name": "update_todo",
+        "description": "Update an existing todo item",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "todo_id": _TODO_ID_PROP,
+                "content": {"type": "string", "description": "The todo item's text"},
+                "description": {"type": "string", "description": "HTML description of the todo"},
+                "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to assign"},
+                "completion_subscriber_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to notify on completion"},
+                "notify": {"type": "boolean", "description": "Whether to notify assignees"},
+                "due_on": {"type": "string", "description": "Due date in YYYY-MM-DD format"},
+                "starts_on": {"type": "string", "description": "Start date in YYYY-MM-DD format"}
             },
-            {
-                "name": "update_todo",
-                "description": "Update an existing todo item",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "todo_id": {"type": "string", "description": "The todo ID"},
-                        "content": {"type": "string", "description": "The todo item's text"},
-                        "description": {"type": "string", "description": "HTML description of the todo"},
-                        "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to assign"},
-                        "completion_subscriber_ids": {"type": "array", "items": {"type": "string"}, "description": "List of person IDs to notify on completion"},
-                        "notify": {"type": "boolean", "description": "Whether to notify assignees"},
-                        "due_on": {"type": "string", "description": "Due date in YYYY-MM-DD format"},
-                        "starts_on": {"type": "string", "description": "Start date in YYYY-MM-DD format"}
-                    },
-                    "required": ["project_id", "todo_id"]
-                }
+            "required": ["project_id", "todo_id"]
+        }
+    },
+    {
+        "name": "delete_todo",
+        "description": "Delete a todo item",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "todo_id": _TODO_ID_PROP
             },
-            {
-                "name": "delete_todo",
-                "description": "Delete a todo item",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "todo_id": {"type": "string", "description": "The todo ID"}
-                    },
-                    "required": ["project_id", "todo_id"]
-                }
+            "required": ["project_id", "todo_id"]
+        }
+    },
+    {
+        "name": "complete_todo",
+        "description": "Mark a todo item as complete",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "todo_id": _TODO_ID_PROP
             },
-            {
-                "name": "complete_todo",
-                "description": "Mark a todo item as complete",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "todo_id": {"type": "string", "description": "The todo ID"}
-                    },
-                    "required": ["project_id", "todo_id"]
-                }
+            "required": ["project_id", "todo_id"]
+        }
+    },
+    {
+        "name": "uncomplete_todo",
+        "description": "Mark a todo item as incomplete",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "todo_id": _TODO_ID_PROP
             },
-            {
-                "name": "uncomplete_todo",
-                "description": "Mark a todo item as incomplete",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "todo_id": {"type": "string", "description": "The todo ID"}
-                    },
-                    "required": ["project_id", "todo_id"]
-                }
+            "required": ["project_id", "todo_id"]
+        }
+    },
+    {
+        "name": "search_basecamp",
+        "description": "Search across Basecamp projects, todos, and messages",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"},
+                "project_id": {"type": "string", "description": "Optional project ID to limit search scope"}
             },
-            {
-                "name": "search_basecamp",
-                "description": "Search across Basecamp projects, todos, and messages",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {"type": "string", "description": "Search query"},
-                        "project_id": {"type": "string", "description": "Optional project ID to limit search scope"}
-                    },
-                    "required": ["query"]
-                }
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "global_search",
+        "description": "Search projects, todos and campfire messages across all projects",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "query": {"type": "string", "description": "Search query"}
             },
-            {
-                "name": "global_search",
-                "description": "Search projects, todos and campfire messages across all projects",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "query": {"type": "string", "description": "Search query"}
-                    },
-                    "required": ["query"]
-                }
+            "required": ["query"]
+        }
+    },
+    {
+        "name": "get_comments",
+        "description": "Get comments for a Basecamp item",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "recording_id": {"type": "string", "description": "The item ID"},
+                "project_id": _PROJECT_ID_PROP,
+                "page": {"type": "integer", "description": "Page number for pagination (default: 1). Basecamp uses geared pagination: page 1 has 15 results, page 2 has 30, page 3 has 50, page 4+ has 100.", "default": 1}
             },
-            {
-                "name": "get_comments",
-                "description": "Get comments for a Basecamp item",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "recording_id": {"type": "string", "description": "The item ID"},
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "page": {"type": "integer", "description": "Page number for pagination (default: 1). Basecamp uses geared pagination: page 1 has 15 results, page 2 has 30, page 3 has 50, page 4+ has 100.", "default": 1}
-                    },
-                    "required": ["recording_id", "project_id"]
-                }
+            "required": ["recording_id", "project_id"]
+        }
+    },
+    {
+        "name": "create_comment",
+        "description": "Create a comment on a Basecamp item",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "recording_id": {"type": "string", "description": "The item ID"},
+                "project_id": _PROJECT_ID_PROP,
+                "content": {"type": "string", "description": "The comment content in HTML format"}
             },
-            {
-                "name": "create_comment",
-                "description": "Create a comment on a Basecamp item",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "recording_id": {"type": "string", "description": "The item ID"},
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "content": {"type": "string", "description": "The comment content in HTML format"}
-                    },
-                    "required": ["recording_id", "project_id", "content"]
-                }
+            "required": ["recording_id", "project_id", "content"]
+        }
+    },
+    {
+        "name": "get_campfire_lines",
+        "description": "Get recent messages from a Basecamp campfire (chat room)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "campfire_id": {"type": "string", "description": "The campfire/chat room ID"}
             },
-            {
-                "name": "get_campfire_lines",
-                "description": "Get recent messages from a Basecamp campfire (chat room)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "campfire_id": {"type": "string", "description": "The campfire/chat room ID"}
-                    },
-                    "required": ["project_id", "campfire_id"]
-                }
+            "required": ["project_id", "campfire_id"]
+        }
+    },
+    {
+        "name": "get_daily_check_ins",
+        "description": "Get project's daily checking questionnaire",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "page": {"type": "integer", "description": "Page number paginated response"}
+            }
+        },
+        "required": ["project_id"]
+    },
+    {
+        "name": "get_question_answers",
+        "description": "Get answers on daily check-in question",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "question_id": {"type": "string", "description": "The question ID"},
+                "page": {"type": "integer", "description": "Page number paginated response"}
+            }
+        },
+        "required": ["project_id", "question_id"]
+    },
+    # Card Table tools
+    {
+        "name": "get_card_tables",
+        "description": "Get all card tables for a project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP
             },
-            {
-                "name": "get_daily_check_ins",
-                "description": "Get project's daily checking questionnaire",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "page": {"type": "integer", "description": "Page number paginated response"}
-                    }
-                },
-                "required": ["project_id"]
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "get_card_table",
+        "description": "Get the card table details for a project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP
             },
-            {
-                "name": "get_question_answers",
-                "description": "Get answers on daily check-in question",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "question_id": {"type": "string", "description": "The question ID"},
-                        "page": {"type": "integer", "description": "Page number paginated response"}
-                    }
-                },
-                "required": ["project_id", "question_id"]
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "get_columns",
+        "description": "Get all columns in a card table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_table_id": _CARD_TABLE_ID_PROP
             },
-            # Card Table tools
-            {
-                "name": "get_card_tables",
-                "description": "Get all card tables for a project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"}
-                    },
-                    "required": ["project_id"]
-                }
+            "required": ["project_id", "card_table_id"]
+        }
+    },
+    {
+        "name": "get_column",
+        "description": "Get details for a specific column",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP
             },
-            {
-                "name": "get_card_table",
-                "description": "Get the card table details for a project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"}
-                    },
-                    "required": ["project_id"]
-                }
+            "required": ["project_id", "column_id"]
+        }
+    },
+    {
+        "name": "create_column",
+        "description": "Create a new column in a card table",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_table_id": _CARD_TABLE_ID_PROP,
+                "title": {"type": "string", "description": "The column title"}
             },
-            {
-                "name": "get_columns",
-                "description": "Get all columns in a card table",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_table_id": {"type": "string", "description": "The card table ID"}
-                    },
-                    "required": ["project_id", "card_table_id"]
-                }
+            "required": ["project_id", "card_table_id", "title"]
+        }
+    },
+    {
+        "name": "update_column",
+        "description": "Update a column title",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP,
+                "title": {"type": "string", "description": "The new column title"}
             },
-            {
-                "name": "get_column",
-                "description": "Get details for a specific column",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"}
-                    },
-                    "required": ["project_id", "column_id"]
-                }
+            "required": ["project_id", "column_id", "title"]
+        }
+    },
+    {
+        "name": "move_column",
+        "description": "Move a column to a new position",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_table_id": _CARD_TABLE_ID_PROP,
+                "column_id": _COLUMN_ID_PROP,
+                "position": {"type": "integer", "description": "The new 1-based position"}
             },
-            {
-                "name": "create_column",
-                "description": "Create a new column in a card table",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_table_id": {"type": "string", "description": "The card table ID"},
-                        "title": {"type": "string", "description": "The column title"}
-                    },
-                    "required": ["project_id", "card_table_id", "title"]
-                }
+            "required": ["project_id", "card_table_id", "column_id", "position"]
+        }
+    },
+    {
+        "name": "update_column_color",
+        "description": "Update a column color",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP,
+                "color": {"type": "string", "description": "The hex color code (e.g., #FF0000)"}
             },
-            {
-                "name": "update_column",
-                "description": "Update a column title",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"},
-                        "title": {"type": "string", "description": "The new column title"}
-                    },
-                    "required": ["project_id", "column_id", "title"]
-                }
+            "required": ["project_id", "column_id", "color"]
+        }
+    },
+    {
+        "name": "put_column_on_hold",
+        "description": "Put a column on hold (freeze work)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP
             },
-            {
-                "name": "move_column",
-                "description": "Move a column to a new position",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_table_id": {"type": "string", "description": "The card table ID"},
-                        "column_id": {"type": "string", "description": "The column ID"},
-                        "position": {"type": "integer", "description": "The new 1-based position"}
-                    },
-                    "required": ["project_id", "card_table_id", "column_id", "position"]
-                }
+            "required": ["project_id", "column_id"]
+        }
+    },
+    {
+        "name": "remove_column_hold",
+        "description": "Remove hold from a column (unfreeze work)",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP
             },
-            {
-                "name": "update_column_color",
-                "description": "Update a column color",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"},
-                        "color": {"type": "string", "description": "The hex color code (e.g., #FF0000)"}
-                    },
-                    "required": ["project_id", "column_id", "color"]
-                }
+            "required": ["project_id", "column_id"]
+        }
+    },
+    {
+        "name": "watch_column",
+        "description": "Subscribe to notifications for changes in a column",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP
             },
-            {
-                "name": "put_column_on_hold",
-                "description": "Put a column on hold (freeze work)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"}
-                    },
-                    "required": ["project_id", "column_id"]
-                }
+            "required": ["project_id", "column_id"]
+        }
+    },
+    {
+        "name": "unwatch_column",
+        "description": "Unsubscribe from notifications for a column",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP
             },
-            {
-                "name": "remove_column_hold",
-                "description": "Remove hold from a column (unfreeze work)",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"}
-                    },
-                    "required": ["project_id", "column_id"]
-                }
+            "required": ["project_id", "column_id"]
+        }
+    },
+    {
+        "name": "get_cards",
+        "description": "Get all cards in a column",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP
             },
-            {
-                "name": "watch_column",
-                "description": "Subscribe to notifications for changes in a column",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"}
-                    },
-                    "required": ["project_id", "column_id"]
-                }
+            "required": ["project_id", "column_id"]
+        }
+    },
+    {
+        "name": "get_card",
+        "description": "Get details for a specific card",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_id": _CARD_ID_PROP
             },
-            {
-                "name": "unwatch_column",
-                "description": "Unsubscribe from notifications for a column",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"}
-                    },
-                    "required": ["project_id", "column_id"]
-                }
+            "required": ["project_id", "card_id"]
+        }
+    },
+    {
+        "name": "create_card",
+        "description": "Create a new card in a column",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "column_id": _COLUMN_ID_PROP,
+                "title": {"type": "string", "description": "The card title"},
+                "content": {"type": "string", "description": "Optional card content/description"},
+                "due_on": {"type": "string", "description": "Optional due date (ISO 8601 format)"},
+                "notify": {"type": "boolean", "description": "Whether to notify assignees (default: false)"}
             },
-            {
-                "name": "get_cards",
-                "description": "Get all cards in a column",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"}
-                    },
-                    "required": ["project_id", "column_id"]
-                }
+            "required": ["project_id", "column_id", "title"]
+        }
+    },
+    {
+        "name": "update_card",
+        "description": "Update a card",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_id": _CARD_ID_PROP,
+                "title": {"type": "string", "description": "The new card title"},
+                "content": {"type": "string", "description": "The new card content/description"},
+                "due_on": {"type": "string", "description": "Due date (ISO 8601 format)"},
+                "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "Array of person IDs to assign to the card"}
             },
-            {
-                "name": "get_card",
-                "description": "Get details for a specific card",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_id": {"type": "string", "description": "The card ID"}
-                    },
-                    "required": ["project_id", "card_id"]
-                }
+            "required": ["project_id", "card_id"]
+        }
+    },
+    {
+        "name": "move_card",
+        "description": "Move a card to a new column",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_id": _CARD_ID_PROP,
+                "column_id": {"type": "string", "description": "The destination column ID"}
             },
-            {
-                "name": "create_card",
-                "description": "Create a new card in a column",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "column_id": {"type": "string", "description": "The column ID"},
-                        "title": {"type": "string", "description": "The card title"},
-                        "content": {"type": "string", "description": "Optional card content/description"},
-                        "due_on": {"type": "string", "description": "Optional due date (ISO 8601 format)"},
-                        "notify": {"type": "boolean", "description": "Whether to notify assignees (default: false)"}
-                    },
-                    "required": ["project_id", "column_id", "title"]
-                }
+            "required": ["project_id", "card_id", "column_id"]
+        }
+    },
+    {
+        "name": "complete_card",
+        "description": "Mark a card as complete",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_id": _CARD_ID_PROP
             },
-            {
-                "name": "update_card",
-                "description": "Update a card",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_id": {"type": "string", "description": "The card ID"},
-                        "title": {"type": "string", "description": "The new card title"},
-                        "content": {"type": "string", "description": "The new card content/description"},
-                        "due_on": {"type": "string", "description": "Due date (ISO 8601 format)"},
-                        "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "Array of person IDs to assign to the card"}
-                    },
-                    "required": ["project_id", "card_id"]
-                }
+            "required": ["project_id", "card_id"]
+        }
+    },
+    {
+        "name": "uncomplete_card",
+        "description": "Mark a card as incomplete",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_id": _CARD_ID_PROP
             },
-            {
-                "name": "move_card",
-                "description": "Move a card to a new column",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_id": {"type": "string", "description": "The card ID"},
-                        "column_id": {"type": "string", "description": "The destination column ID"}
-                    },
-                    "required": ["project_id", "card_id", "column_id"]
-                }
+            "required": ["project_id", "card_id"]
+        }
+    },
+    {
+        "name": "get_card_steps",
+        "description": "Get all steps (sub-tasks) for a card",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_id": _CARD_ID_PROP
             },
-            {
-                "name": "complete_card",
-                "description": "Mark a card as complete",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_id": {"type": "string", "description": "The card ID"}
-                    },
-                    "required": ["project_id", "card_id"]
-                }
+            "required": ["project_id", "card_id"]
+        }
+    },
+    {
+        "name": "create_card_step",
+        "description": "Create a new step (sub-task) for a card",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "card_id": _CARD_ID_PROP,
+                "title": {"type": "string", "description": "The step title"},
+                "due_on": {"type": "string", "description": "Optional due date (ISO 8601 format)"},
+                "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "Array of person IDs to assign to the step"}
             },
-            {
-                "name": "uncomplete_card",
-                "description": "Mark a card as incomplete",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_id": {"type": "string", "description": "The card ID"}
-                    },
-                    "required": ["project_id", "card_id"]
-                }
+            "required": ["project_id", "card_id", "title"]
+        }
+    },
+    {
+        "name": "get_card_step",
+        "description": "Get details for a specific card step",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "step_id": _STEP_ID_PROP
             },
-            {
-                "name": "get_card_steps",
-                "description": "Get all steps (sub-tasks) for a card",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_id": {"type": "string", "description": "The card ID"}
-                    },
-                    "required": ["project_id", "card_id"]
-                }
+            "required": ["project_id", "step_id"]
+        }
+    },
+    {
+        "name": "update_card_step",
+        "description": "Update a card step",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "step_id": _STEP_ID_PROP,
+                "title": {"type": "string", "description": "The step title"},
+                "due_on": {"type": "string", "description": "Due date (ISO 8601 format)"},
+                "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "Array of person IDs to assign to the step"}
             },
-            {
-                "name": "create_card_step",
-                "description": "Create a new step (sub-task) for a card",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "card_id": {"type": "string", "description": "The card ID"},
-                        "title": {"type": "string", "description": "The step title"},
-                        "due_on": {"type": "string", "description": "Optional due date (ISO 8601 format)"},
-                        "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "Array of person IDs to assign to the step"}
-                    },
-                    "required": ["project_id", "card_id", "title"]
-                }
+            "required": ["project_id", "step_id"]
+        }
+    },
+    {
+        "name": "delete_card_step",
+        "description": "Delete a card step",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "step_id": _STEP_ID_PROP
             },
-            {
-                "name": "get_card_step",
-                "description": "Get details for a specific card step",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "step_id": {"type": "string", "description": "The step ID"}
-                    },
-                    "required": ["project_id", "step_id"]
-                }
+            "required": ["project_id", "step_id"]
+        }
+    },
+    {
+        "name": "complete_card_step",
+        "description": "Mark a card step as complete",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "step_id": _STEP_ID_PROP
             },
-            {
-                "name": "update_card_step",
-                "description": "Update a card step",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "step_id": {"type": "string", "description": "The step ID"},
-                        "title": {"type": "string", "description": "The step title"},
-                        "due_on": {"type": "string", "description": "Due date (ISO 8601 format)"},
-                        "assignee_ids": {"type": "array", "items": {"type": "string"}, "description": "Array of person IDs to assign to the step"}
-                    },
-                    "required": ["project_id", "step_id"]
-                }
+            "required": ["project_id", "step_id"]
+        }
+    },
+    {
+        "name": "uncomplete_card_step",
+        "description": "Mark a card step as incomplete",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "step_id": _STEP_ID_PROP
             },
-            {
-                "name": "delete_card_step",
-                "description": "Delete a card step",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "step_id": {"type": "string", "description": "The step ID"}
-                    },
-                    "required": ["project_id", "step_id"]
-                }
+            "required": ["project_id", "step_id"]
+        }
+    },
+    {
+        "name": "create_attachment",
+        "description": "Upload a file as an attachment",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "file_path": {"type": "string", "description": "Local path to file"},
+                "name": {"type": "string", "description": "Filename for Basecamp"},
+                "content_type": {"type": "string", "description": "MIME type"}
             },
-            {
-                "name": "complete_card_step",
-                "description": "Mark a card step as complete",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "step_id": {"type": "string", "description": "The step ID"}
-                    },
-                    "required": ["project_id", "step_id"]
-                }
+            "required": ["file_path", "name"]
+        }
+    },
+    {
+        "name": "get_events",
+        "description": "Get events for a recording",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "recording_id": {"type": "string", "description": "Recording ID"},
+                "page": {"type": "integer", "description": "Page number for pagination (default: 1). Basecamp uses geared pagination: page 1 has 15 results, page 2 has 30, page 3 has 50, page 4+ has 100.", "default": 1},
+                "auto_paginate": _AUTO_PAGINATE_PROP,
+                "max_pages": _MAX_PAGES_PROP
             },
-            {
-                "name": "uncomplete_card_step",
-                "description": "Mark a card step as incomplete",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "step_id": {"type": "string", "description": "The step ID"}
-                    },
-                    "required": ["project_id", "step_id"]
-                }
+            "required": ["project_id", "recording_id"]
+        }
+    },
+    {
+        "name": "get_recordings",
+        "description": "Get recordings of a specific type across projects (global activity feed). Use this to browse recent activity across all projects or within specific ones.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "type": {"type": "string", "description": "Recording type. Must be one of: Comment, Document, Kanban::Card, Kanban::Step, Message, Question::Answer, Schedule::Entry, Todo, Todolist, Upload, Vault"},
+                "bucket": {"type": "string", "description": "Optional comma-separated project IDs to filter by (e.g. '123' or '123,456'). Defaults to all active projects."},
+                "status": {"type": "string", "description": "Filter by status: active, archived, or trashed (default: active)", "default": "active"},
+                "sort": {"type": "string", "description": "Sort field: created_at or updated_at (default: created_at)", "default": "created_at"},
+                "direction": {"type": "string", "description": "Sort direction: desc or asc (default: desc)", "default": "desc"},
+                "page": _PAGE_PROP,
+                "auto_paginate": _AUTO_PAGINATE_PROP,
+                "max_pages": _MAX_PAGES_PROP
             },
-            {
-                "name": "create_attachment",
-                "description": "Upload a file as an attachment",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "file_path": {"type": "string", "description": "Local path to file"},
-                        "name": {"type": "string", "description": "Filename for Basecamp"},
-                        "content_type": {"type": "string", "description": "MIME type"}
-                    },
-                    "required": ["file_path", "name"]
-                }
+            "required": ["type"]
+        }
+    },
+    {
+        "name": "get_webhooks",
+        "description": "List webhooks for a project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP
             },
-            {
-                "name": "get_events",
-                "description": "Get events for a recording",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "recording_id": {"type": "string", "description": "Recording ID"},
-                        "page": {"type": "integer", "description": "Page number for pagination (default: 1). Basecamp uses geared pagination: page 1 has 15 results, page 2 has 30, page 3 has 50, page 4+ has 100.", "default": 1}
-                    },
-                    "required": ["project_id", "recording_id"]
-                }
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "create_webhook",
+        "description": "Create a webhook",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "payload_url": {"type": "string", "description": "Payload URL"},
+                "types": {"type": "array", "items": {"type": "string"}, "description": "Event types"}
             },
-            {
-                "name": "get_recordings",
-                "description": "Get recordings of a specific type across projects (global activity feed). Use this to browse recent activity across all projects or within specific ones.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "type": {"type": "string", "description": "Recording type. Must be one of: Comment, Document, Kanban::Card, Kanban::Step, Message, Question::Answer, Schedule::Entry, Todo, Todolist, Upload, Vault"},
-                        "bucket": {"type": "string", "description": "Optional comma-separated project IDs to filter by (e.g. '123' or '123,456'). Defaults to all active projects."},
-                        "status": {"type": "string", "description": "Filter by status: active, archived, or trashed (default: active)", "default": "active"},
-                        "sort": {"type": "string", "description": "Sort field: created_at or updated_at (default: created_at)", "default": "created_at"},
-                        "direction": {"type": "string", "description": "Sort direction: desc or asc (default: desc)", "default": "desc"},
-                        "page": {"type": "integer", "description": "Page number for pagination (default: 1)", "default": 1}
-                    },
-                    "required": ["type"]
-                }
+            "required": ["project_id", "payload_url"]
+        }
+    },
+    {
+        "name": "delete_webhook",
+        "description": "Delete a webhook",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "webhook_id": {"type": "string", "description": "Webhook ID"}
             },
-            {
-                "name": "get_webhooks",
-                "description": "List webhooks for a project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"}
-                    },
-                    "required": ["project_id"]
-                }
+            "required": ["project_id", "webhook_id"]
+        }
+    },
+    {
+        "name": "get_documents",
+        "description": "List documents in a vault",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "vault_id": {"type": "string", "description": "Vault ID"}
             },
-            {
-                "name": "create_webhook",
-                "description": "Create a webhook",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "payload_url": {"type": "string", "description": "Payload URL"},
-                        "types": {"type": "array", "items": {"type": "string"}, "description": "Event types"}
-                    },
-                    "required": ["project_id", "payload_url"]
-                }
+            "required": ["project_id", "vault_id"]
+        }
+    },
+    {
+        "name": "get_document",
+        "description": "Get a single document",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "document_id": {"type": "string", "description": "Document ID"}
             },
-            {
-                "name": "delete_webhook",
-                "description": "Delete a webhook",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "webhook_id": {"type": "string", "description": "Webhook ID"}
-                    },
-                    "required": ["project_id", "webhook_id"]
-                }
+            "required": ["project_id", "document_id"]
+        }
+    },
+    {
+        "name": "create_document",
+        "description": "Create a document in a vault",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "vault_id": {"type": "string", "description": "Vault ID"},
+                "title": {"type": "string", "description": "Document title"},
+                "content": {"type": "string", "description": "Document HTML content"}
             },
-            {
-                "name": "get_documents",
-                "description": "List documents in a vault",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "vault_id": {"type": "string", "description": "Vault ID"}
-                    },
-                    "required": ["project_id", "vault_id"]
-                }
+            "required": ["project_id", "vault_id", "title", "content"]
+        }
+    },
+    {
+        "name": "update_document",
+        "description": "Update a document",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "document_id": {"type": "string", "description": "Document ID"},
+                "title": {"type": "string", "description": "New title"},
+                "content": {"type": "string", "description": "New HTML content"}
             },
-            {
-                "name": "get_document",
-                "description": "Get a single document",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "document_id": {"type": "string", "description": "Document ID"}
-                    },
-                    "required": ["project_id", "document_id"]
-                }
+            "required": ["project_id", "document_id"]
+        }
+    },
+    {
+        "name": "trash_document",
+        "description": "Move a document to trash",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "document_id": {"type": "string", "description": "Document ID"}
             },
-            {
-                "name": "create_document",
-                "description": "Create a document in a vault",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "vault_id": {"type": "string", "description": "Vault ID"},
-                        "title": {"type": "string", "description": "Document title"},
-                        "content": {"type": "string", "description": "Document HTML content"}
-                    },
-                    "required": ["project_id", "vault_id", "title", "content"]
-                }
+            "required": ["project_id", "document_id"]
+        }
+    },
+    # Timeline tools
+    {
+        "name": "get_timeline",
+        "description": "Get timeline events across all projects (global activity feed). Shows recent activity like messages posted, to-dos completed, files uploaded, etc.",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "page": _PAGE_PROP,
+                "auto_paginate": _AUTO_PAGINATE_PROP,
+                "max_pages": _MAX_PAGES_PROP
             },
-            {
-                "name": "update_document",
-                "description": "Update a document",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "document_id": {"type": "string", "description": "Document ID"},
-                        "title": {"type": "string", "description": "New title"},
-                        "content": {"type": "string", "description": "New HTML content"}
-                    },
-                    "required": ["project_id", "document_id"]
-                }
+            "required": []
+        }
+    },
+    {
+        "name": "get_project_timeline",
+        "description": "Get timeline events for a specific project",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "project_id": _PROJECT_ID_PROP,
+                "page": _PAGE_PROP
             },
-            {
-                "name": "trash_document",
-                "description": "Move a document to trash",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "Project ID"},
-                        "document_id": {"type": "string", "description": "Document ID"}
-                    },
-                    "required": ["project_id", "document_id"]
-                }
+            "required": ["project_id"]
+        }
+    },
+    {
+        "name": "get_person_timeline",
+        "description": "Get timeline events created by a specific person",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "person_id": _PERSON_ID_PROP,
+                "page": _PAGE_PROP
             },
-            # Timeline tools
-            {
-                "name": "get_timeline",
-                "description": "Get timeline events across all projects (global activity feed). Shows recent activity like messages posted, to-dos completed, files uploaded, etc.",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "page": {"type": "integer", "description": "Page number for pagination (default: 1)", "default": 1}
-                    },
-                    "required": []
-                }
+            "required": ["person_id"]
+        }
+    },
+    # Report tools
+    {
+        "name": "get_todo_assignees",
+        "description": "Get list of all people who can have to-dos assigned to them",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    {
+        "name": "get_person_todos",
+        "description": "Get all active, pending to-dos assigned to a person",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "person_id": _PERSON_ID_PROP,
+                "group_by": {"type": "string", "description": "Group by 'bucket' (project) or 'date' (due date). Default: 'bucket'.", "default": "bucket"}
             },
-            {
-                "name": "get_project_timeline",
-                "description": "Get timeline events for a specific project",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "project_id": {"type": "string", "description": "The project ID"},
-                        "page": {"type": "integer", "description": "Page number for pagination (default: 1)", "default": 1}
-                    },
-                    "required": ["project_id"]
-                }
+            "required": ["person_id"]
+        }
+    },
+    {
+        "name": "get_overdue_todos",
+        "description": "Get all overdue to-dos across all projects, grouped by how late they are",
+        "inputSchema": {
+            "type": "object",
+            "properties": {},
+            "required": []
+        }
+    },
+    {
+        "name": "get_upcoming_schedule",
+        "description": "Get schedule entries and assignable items within a date window",
+        "inputSchema": {
+            "type": "object",
+            "properties": {
+                "window_starts_on": {"type": "string", "description": "Start date in YYYY-MM-DD format"},
+                "window_ends_on": {"type": "string", "description": "End date in YYYY-MM-DD format"}
             },
-            {
-                "name": "get_person_timeline",
-                "description": "Get timeline events created by a specific person",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "person_id": {"type": "string", "description": "The person ID"},
-                        "page": {"type": "integer", "description": "Page number for pagination (default: 1)", "default": 1}
-                    },
-                    "required": ["person_id"]
-                }
-            },
-            # Report tools
-            {
-                "name": "get_todo_assignees",
-                "description": "Get list of all people who can have to-dos assigned to them",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "get_person_todos",
-                "description": "Get all active, pending to-dos assigned to a person",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "person_id": {"type": "string", "description": "The person ID"},
-                        "group_by": {"type": "string", "description": "Group by 'bucket' (project) or 'date' (due date). Default: 'bucket'.", "default": "bucket"}
-                    },
-                    "required": ["person_id"]
-                }
-            },
-            {
-                "name": "get_overdue_todos",
-                "description": "Get all overdue to-dos across all projects, grouped by how late they are",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {},
-                    "required": []
-                }
-            },
-            {
-                "name": "get_upcoming_schedule",
-                "description": "Get schedule entries and assignable items within a date window",
-                "inputSchema": {
-                    "type": "object",
-                    "properties": {
-                        "window_starts_on": {"type": "string", "description": "Start date in YYYY-MM-DD format"},
-                        "window_ends_on": {"type": "string", "description": "End date in YYYY-MM-DD format"}
-                    },
-                    "required": ["window_starts_on", "window_ends_on"]
-                }
-            }
-        ]
+            "required": ["window_starts_on", "window_ends_on"]
+        }
+    }
+)
+
+_AUTH_REQUIRED_ERROR = {
+    "error": "Authentication required",
+    "message": "Please authenticate with Basecamp first. Visit http://localhost:8000 to log in."
+}
+
+# _get_basecamp_client() failure reason -> tool result returned to the caller
+_AUTH_ERRORS = {
+    "expired": {
+        "error": "OAuth token expired",
+        "message": "Your Basecamp OAuth token has expired. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
+    },
+    "unauth": _AUTH_REQUIRED_ERROR,
+    "no_account": _AUTH_REQUIRED_ERROR,
+}
+
+# Tools that only read from Basecamp; their results are cached for _RESPONSE_TTL
+_READ_ONLY_TOOLS = frozenset({
+    "get_projects", "get_project", "get_todolists",
+    "get_card_tables", "get_card_table", "get_columns", "get_column",
+    "get_timeline", "get_project_timeline", "get_person_timeline",
+    "get_events", "get_recordings", "get_webhooks",
+    "get_documents", "get_document",
+    "get_todo_assignees", "get_person_todos", "get_overdue_todos",
+    "get_upcoming_schedule",
+})
+
+# Reads that reflect every change made in a project
+_ACTIVITY_TOOLS = frozenset({
+    "get_timeline", "get_project_timeline", "get_person_timeline",
+    "get_events", "get_recordings",
+})
+_TODO_READ_TOOLS = _ACTIVITY_TOOLS | {
+    "get_todolists", "get_todo_assignees", "get_person_todos",
+    "get_overdue_todos", "get_upcoming_schedule",
+}
+_CARD_TABLE_READ_TOOLS = _ACTIVITY_TOOLS | {
+    "get_card_tables", "get_card_table", "get_columns", "get_column",
+    "get_upcoming_schedule",
+}
+_DOCUMENT_READ_TOOLS = _ACTIVITY_TOOLS | {"get_documents", "get_document"}
+
+# Write tool -> cached read-only tools whose results it can make stale.
+# Results scoped to another project_id are kept.
+_INVALIDATES = {
+    **dict.fromkeys(
+        ("create_todo", "update_todo", "delete_todo", "complete_todo", "uncomplete_todo"),
+        _TODO_READ_TOOLS,
+    ),
+    **dict.fromkeys(
+        ("create_column", "update_column", "move_column", "update_column_color",
+         "put_column_on_hold", "remove_column_hold", "watch_column", "unwatch_column",
+         "create_card", "update_card", "move_card", "complete_card", "uncomplete_card"),
+        _CARD_TABLE_READ_TOOLS,
+    ),
+    **dict.fromkeys(
+        ("create_comment", "create_card_step", "update_card_step", "delete_card_step",
+         "complete_card_step", "uncomplete_card_step"),
+        _ACTIVITY_TOOLS,
+    ),
+    **dict.fromkeys(("create_document", "update_document", "trash_document"), _DOCUMENT_READ_TOOLS),
+    **dict.fromkeys(("create_webhook", "delete_webhook"), frozenset({"get_webhooks"})),
+}
+
+# Tool name -> names of its required arguments, taken from the schemas
+_REQUIRED_ARGS = {
+    tool["name"]: tuple(tool["inputSchema"].get("required", ()))
+    for tool in _TOOLS
+}
+
+
+def _parse_int(value: str) -> Any:
+    try:
+        return int(value)
+    except ValueError:
+        return value  # Left for the handler to reject or default
+
+
+# Parsers for schema types that clients sometimes send as strings
+_STRING_PARSERS = {"boolean": _parse_bool, "integer": _parse_int}
+
+# Tool name -> (argument, parser) for each boolean/integer argument in its schema
+_ARG_PARSERS = {
+    tool["name"]: tuple(
+        (name, _STRING_PARSERS[prop["type"]])
+        for name, prop in tool["inputSchema"]["properties"].items()
+        if prop.get("type") in _STRING_PARSERS
+    )
+    for tool in _TOOLS
+}
+
+
+def _coerce_arguments(tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Convert string values of boolean/integer arguments to their schema type.
+
+    Returns the arguments unchanged (not copied) when nothing needs converting.
+    """
+    coerced = None
+    for name, parse in _ARG_PARSERS[tool_name]:
+        value = arguments.get(name)
+        if isinstance(value, str):
+            if coerced is None:
+                coerced = dict(arguments)
+            coerced[name] = parse(value)
+    return arguments if coerced is None else coerced
+
+# tools/list and ListOfferings results. They never change, so each is built
+# once and its JSON is encoded only on first use.
+_TOOLS_LIST_RESULT = {"tools": _TOOLS}
+_OFFERINGS_RESULT = {
+    "offerings": [
+        {
+            "name": tool.get("name"),
+            "displayName": tool.get("name"),
+            "description": tool.get("description")
+        }
+        for tool in _TOOLS
+    ]
+}
+_static_result_json: dict[int, bytes] = {}
+
+
+def _encode_response(response: dict[str, Any]) -> bytes:
+    """Serialize a JSON-RPC response, reusing the cached static result encodings."""
+    result = response.get("result")
+    if result is _TOOLS_LIST_RESULT or result is _OFFERINGS_RESULT:
+        encoded = _static_result_json.get(id(result))
+        if encoded is None:
+            encoded = _static_result_json[id(result)] = _dumpb(result)
+        return b'{"jsonrpc":"2.0","id":%s,"result":%s}' % (_dumpb(response.get("id")), encoded)
+    return _dumpb(response)
+
+
+# Parse errors carry no request id, so the whole response is a constant
+_PARSE_ERROR_RESPONSE = b'{"jsonrpc":"2.0","id":null,"error":{"code":-32700,"message":"Parse error"}}'
+
+
+def _write_message(data: bytes) -> None:
+    """Write one newline-framed message to stdout and flush it."""
+    out = sys.stdout.buffer
+    out.write(data)
+    out.write(b"\n")
+    out.flush()
+
+
+# Tool implementations, one per entry in _TOOLS. Each takes the authenticated
+# client and the call arguments and returns the tool result.
+
+def _tool_get_projects(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    projects = client.get_projects()
+    return {
+        "status": "success",
+        "projects": projects,
+        "count": len(projects)
+    }
+
+
+def _tool_get_project(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    project = client.get_project(project_id)
+    return {
+        "status": "success",
+        "project": project
+    }
+
+
+def _tool_get_todolists(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    todolists = client.get_todolists(project_id)
+    return {
+        "status": "success",
+        "todolists": todolists,
+        "count": len(todolists)
+    }
+
+
+def _tool_get_todos(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    todolist_id = arguments.get("todolist_id")
+    project_id = arguments.get("project_id")
+    todos = client.get_todos(project_id, todolist_id)
+    return {
+        "status": "success",
+        "todos": todos,
+        "count": len(todos)
+    }
+
+
+def _tool_create_todo(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    todolist_id = arguments.get("todolist_id")
+    content = arguments.get("content")
+    description = arguments.get("description")
+    assignee_ids = arguments.get("assignee_ids")
+    completion_subscriber_ids = arguments.get("completion_subscriber_ids")
+    notify = bool(arguments.get("notify", False))
+    due_on = arguments.get("due_on")
+    starts_on = arguments.get("starts_on")
+
+    todo = client.create_todo(
+        project_id, todolist_id, content,
+        description=description,
+        assignee_ids=assignee_ids,
+        completion_subscriber_ids=completion_subscriber_ids,
+        notify=notify,
+        due_on=due_on,
+        starts_on=starts_on
+    )
+    return {
+        "status": "success",
+        "todo": todo,
+        "message": f"Todo '{content}' created successfully"
+    }
+
+
+def _tool_update_todo(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    todo_id = arguments.get("todo_id")
+    content = arguments.get("content")
+    description = arguments.get("description")
+    assignee_ids = arguments.get("assignee_ids")
+    completion_subscriber_ids = arguments.get("completion_subscriber_ids")
+    due_on = arguments.get("due_on")
+    starts_on = arguments.get("starts_on")
+    notify = arguments.get("notify")
+
+    todo = client.update_todo(
+        project_id, todo_id,
+        content=content,
+        description=description,
+        assignee_ids=assignee_ids,
+        completion_subscriber_ids=completion_subscriber_ids,
+        notify=notify,
+        due_on=due_on,
+        starts_on=starts_on
+    )
+    return {
+        "status": "success",
+        "todo": todo,
+        "message": "Todo updated successfully"
+    }
+
+
+def _tool_delete_todo(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    todo_id = arguments.get("todo_id")
+    client.delete_todo(project_id, todo_id)
+    return {
+        "status": "success",
+        "message": "Todo deleted successfully"
+    }
+
+
+def _tool_complete_todo(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    todo_id = arguments.get("todo_id")
+    completion = client.complete_todo(project_id, todo_id)
+    return {
+        "status": "success",
+        "completion": completion,
+        "message": "Todo marked as complete"
+    }
+
+
+def _tool_uncomplete_todo(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    todo_id = arguments.get("todo_id")
+    client.uncomplete_todo(project_id, todo_id)
+    return {
+        "status": "success",
+        "message": "Todo marked as incomplete"
+    }
+
+
+# Search helper for the current client, reused across search tool calls
+_search: BasecampSearch | None = None
+
+
+def _get_search(client: BasecampClient) -> BasecampSearch:
+    """Return a BasecampSearch for client, building one only when the client changes."""
+    global _search
+    if _search is None or _search.client is not client:
+        _search = _lazy("BasecampSearch")(client=client)
+    return _search
+
+
+# Thread pool for the sub-queries of search_basecamp, created on first use
+_search_executor: ThreadPoolExecutor | None = None
+
+
+def _get_search_executor() -> ThreadPoolExecutor:
+    global _search_executor
+    if _search_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _search_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="search")
+    return _search_executor
+
+
+def _tool_search_basecamp(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    query = arguments.get("query")
+    project_id = arguments.get("project_id")
+
+    search = _get_search(client)
+
+    if project_id:
+        # Search within specific project
+        tasks = {
+            "todolists": (search.search_todolists, query, project_id),
+            "todos": (search.search_todos, query, project_id),
+        }
+    else:
+        # Search across all projects
+        tasks = {
+            "projects": (search.search_projects, query),
+            "todos": (search.search_todos, query),
+            "messages": (search.search_messages, query),
+        }
+
+    # The searches are independent HTTP calls, so run them concurrently
+    executor = _get_search_executor()
+    futures = {key: executor.submit(*task) for key, task in tasks.items()}
+    results = {key: future.result() for key, future in futures.items()}
+
+    return {
+        "status": "success",
+        "query": query,
+        "results": results
+    }
+
+
+def _tool_global_search(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    query = arguments.get("query")
+    search = _get_search(client)
+    results = search.global_search(query)
+    return {
+        "status": "success",
+        "query": query,
+        "results": results
+    }
+
+
+def _tool_get_comments(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    recording_id = arguments.get("recording_id")
+    project_id = arguments.get("project_id")
+    page = arguments.get("page", 1)
+    result = client.get_comments(project_id, recording_id, page)
+    return {
+        "status": "success",
+        "comments": result["comments"],
+        "count": len(result["comments"]),
+        "page": page,
+        "total_count": result["total_count"],
+        "next_page": result["next_page"]
+    }
+
+
+def _tool_create_comment(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    recording_id = arguments.get("recording_id")
+    project_id = arguments.get("project_id")
+    content = arguments.get("content")
+    comment = client.create_comment(recording_id, project_id, content)
+    return {
+        "status": "success",
+        "comment": comment,
+        "message": "Comment created successfully"
+    }
+
+
+def _tool_get_campfire_lines(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    campfire_id = arguments.get("campfire_id")
+    lines = client.get_campfire_lines(project_id, campfire_id)
+    return {
+        "status": "success",
+        "campfire_lines": lines,
+        "count": len(lines)
+    }
+
+
+def _tool_get_daily_check_ins(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    page = arguments.get("page", 1)
+    if page is not None and not isinstance(page, int):
+        page = 1
+    answers = client.get_daily_check_ins(project_id, page=page)
+    return {
+        "status": "success",
+        "campfire_lines": answers,
+        "count": len(answers)
+    }
+
+
+def _tool_get_question_answers(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    question_id = arguments.get("question_id")
+    page = arguments.get("page", 1)
+    if page is not None and not isinstance(page, int):
+        page = 1
+    answers = client.get_question_answers(project_id, question_id, page=page)
+    return {
+        "status": "success",
+        "campfire_lines": answers,
+        "count": len(answers)
+    }
+
+
+# Card Table tools implementation
+def _tool_get_card_tables(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_tables = client.get_card_tables(project_id)
+    return {
+        "status": "success",
+        "card_tables": card_tables,
+        "count": len(card_tables)
+    }
+
+
+def _tool_get_card_table(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    from basecamp_client import TokenExpiredError
+
+    project_id = arguments.get("project_id")
+    try:
+        card_table = client.get_card_table(project_id)
+        card_table_details = client.get_card_table_details(project_id, card_table['id'])
+        return {
+            "status": "success",
+            "card_table": card_table_details
+        }
+    except TokenExpiredError:
+        raise  # Reported by _execute_tool, which also drops the cached client
+    except Exception as e:
+        error_msg = str(e)
+        return {
+            "status": "error",
+            "message": f"Error getting card table: {error_msg}",
+            "debug": error_msg
+        }
+
+
+def _tool_get_columns(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_table_id = arguments.get("card_table_id")
+    columns = client.get_columns(project_id, card_table_id)
+    return {
+        "status": "success",
+        "columns": columns,
+        "count": len(columns)
+    }
+
+
+def _tool_get_column(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    column = client.get_column(project_id, column_id)
+    return {
+        "status": "success",
+        "column": column
+    }
+
+
+def _tool_create_column(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_table_id = arguments.get("card_table_id")
+    title = arguments.get("title")
+    column = client.create_column(project_id, card_table_id, title)
+    return {
+        "status": "success",
+        "column": column,
+        "message": f"Column '{title}' created successfully"
+    }
+
+
+def _tool_update_column(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    title = arguments.get("title")
+    column = client.update_column(project_id, column_id, title)
+    return {
+        "status": "success",
+        "column": column,
+        "message": "Column updated successfully"
+    }
+
+
+def _tool_move_column(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_table_id = arguments.get("card_table_id")
+    column_id = arguments.get("column_id")
+    position = arguments.get("position")
+    client.move_column(project_id, column_id, position, card_table_id)
+    return {
+        "status": "success",
+        "message": f"Column moved to position {position}"
+    }
+
+
+def _tool_update_column_color(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    color = arguments.get("color")
+    column = client.update_column_color(project_id, column_id, color)
+    return {
+        "status": "success",
+        "column": column,
+        "message": f"Column color updated to {color}"
+    }
+
+
+def _tool_put_column_on_hold(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    client.put_column_on_hold(project_id, column_id)
+    return {
+        "status": "success",
+        "message": "Column put on hold"
+    }
+
+
+def _tool_remove_column_hold(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    client.remove_column_hold(project_id, column_id)
+    return {
+        "status": "success",
+        "message": "Column hold removed"
+    }
+
+
+def _tool_watch_column(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    client.watch_column(project_id, column_id)
+    return {
+        "status": "success",
+        "message": "Column notifications enabled"
+    }
+
+
+def _tool_unwatch_column(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    client.unwatch_column(project_id, column_id)
+    return {
+        "status": "success",
+        "message": "Column notifications disabled"
+    }
+
+
+def _tool_get_cards(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    cards = client.get_cards(project_id, column_id)
+    return {
+        "status": "success",
+        "cards": cards,
+        "count": len(cards)
+    }
+
+
+def _tool_get_card(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_id = arguments.get("card_id")
+    card = client.get_card(project_id, card_id)
+    return {
+        "status": "success",
+        "card": card
+    }
+
+
+def _tool_create_card(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    column_id = arguments.get("column_id")
+    title = arguments.get("title")
+    content = arguments.get("content")
+    due_on = arguments.get("due_on")
+    notify = bool(arguments.get("notify", False))
+    card = client.create_card(project_id, column_id, title, content, due_on, notify)
+    return {
+        "status": "success",
+        "card": card,
+        "message": f"Card '{title}' created successfully"
+    }
+
+
+def _tool_update_card(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_id = arguments.get("card_id")
+    title = arguments.get("title")
+    content = arguments.get("content")
+    due_on = arguments.get("due_on")
+    assignee_ids = arguments.get("assignee_ids")
+    card = client.update_card(project_id, card_id, title, content, due_on, assignee_ids)
+    return {
+        "status": "success",
+        "card": card,
+        "message": "Card updated successfully"
+    }
+
+
+def _tool_move_card(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_id = arguments.get("card_id")
+    column_id = arguments.get("column_id")
+    client.move_card(project_id, card_id, column_id)
+    message = "Card moved"
+    if column_id:
+        message = f"Card moved to column {column_id}"
+    return {
+        "status": "success",
+        "message": message
+    }
+
+
+def _tool_complete_card(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_id = arguments.get("card_id")
+    client.complete_card(project_id, card_id)
+    return {
+        "status": "success",
+        "message": "Card marked as complete"
+    }
+
+
+def _tool_uncomplete_card(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_id = arguments.get("card_id")
+    client.uncomplete_card(project_id, card_id)
+    return {
+        "status": "success",
+        "message": "Card marked as incomplete"
+    }
+
+
+def _tool_get_card_steps(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_id = arguments.get("card_id")
+    steps = client.get_card_steps(project_id, card_id)
+    return {
+        "status": "success",
+        "steps": steps,
+        "count": len(steps)
+    }
+
+
+def _tool_create_card_step(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    card_id = arguments.get("card_id")
+    title = arguments.get("title")
+    due_on = arguments.get("due_on")
+    assignee_ids = arguments.get("assignee_ids")
+    step = client.create_card_step(project_id, card_id, title, due_on, assignee_ids)
+    return {
+        "status": "success",
+        "step": step,
+        "message": f"Step '{title}' created successfully"
+    }
+
+
+def _tool_get_card_step(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    step_id = arguments.get("step_id")
+    step = client.get_card_step(project_id, step_id)
+    return {
+        "status": "success",
+        "step": step
+    }
+
+
+def _tool_update_card_step(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    step_id = arguments.get("step_id")
+    title = arguments.get("title")
+    due_on = arguments.get("due_on")
+    assignee_ids = arguments.get("assignee_ids")
+    step = client.update_card_step(project_id, step_id, title, due_on, assignee_ids)
+    return {
+        "status": "success",
+        "step": step,
+        "message": f"Step '{title}' updated successfully"
+    }
+
+
+def _tool_delete_card_step(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    step_id = arguments.get("step_id")
+    client.delete_card_step(project_id, step_id)
+    return {
+        "status": "success",
+        "message": "Step deleted successfully"
+    }
+
+
+def _tool_complete_card_step(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    step_id = arguments.get("step_id")
+    client.complete_card_step(project_id, step_id)
+    return {
+        "status": "success",
+        "message": "Step marked as complete"
+    }
+
+
+def _tool_uncomplete_card_step(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    step_id = arguments.get("step_id")
+    client.uncomplete_card_step(project_id, step_id)
+    return {
+        "status": "success",
+        "message": "Step marked as incomplete"
+    }
+
+
+def _tool_create_attachment(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    file_path = arguments.get("file_path")
+    name = arguments.get("name")
+    content_type = arguments.get("content_type", "application/octet-stream")
+    result = client.create_attachment(file_path, name, content_type)
+    return {
+        "status": "success",
+        "attachment": result
+    }
+
+
+def _max_pages(arguments: dict[str, Any]) -> int:
+    """Return the max_pages argument clamped to 1..MAX_FETCH_PAGES."""
+    from basecamp_client import MAX_FETCH_PAGES
+
+    max_pages = arguments.get("max_pages", 5)
+    if isinstance(max_pages, bool) or not isinstance(max_pages, int):
+        raise ValueError(f"max_pages must be an integer, got {max_pages!r}")
+    return max(1, min(max_pages, MAX_FETCH_PAGES))
+
+
+def _tool_get_events(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    recording_id = arguments.get("recording_id")
+    page = arguments.get("page", 1)
+    if arguments.get("auto_paginate"):
+        events = client.fetch_pages(
+            lambda p: client.get_events(project_id, recording_id, p),
+            page, _max_pages(arguments)
+        )
+    else:
+        events = client.get_events(project_id, recording_id, page)
+    return {
+        "status": "success",
+        "events": events,
+        "count": len(events)
+    }
+
+
+def _tool_get_recordings(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    type_ = arguments.get("type")
+    bucket = arguments.get("bucket")
+    status = arguments.get("status", "active")
+    sort = arguments.get("sort", "created_at")
+    direction = arguments.get("direction", "desc")
+    page = arguments.get("page", 1)
+    if arguments.get("auto_paginate"):
+        recordings = client.fetch_pages(
+            lambda p: client.get_recordings(type_, bucket, status, sort, direction, p),
+            page, _max_pages(arguments)
+        )
+    else:
+        recordings = client.get_recordings(type_, bucket, status, sort, direction, page)
+    return {
+        "status": "success",
+        "recordings": recordings,
+        "count": len(recordings)
+    }
+
+
+def _tool_get_webhooks(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    hooks = client.get_webhooks(project_id)
+    return {
+        "status": "success",
+        "webhooks": hooks,
+        "count": len(hooks)
+    }
+
+
+def _tool_create_webhook(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    payload_url = arguments.get("payload_url")
+    types = arguments.get("types")
+    hook = client.create_webhook(project_id, payload_url, types)
+    return {
+        "status": "success",
+        "webhook": hook
+    }
+
+
+def _tool_delete_webhook(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    webhook_id = arguments.get("webhook_id")
+    client.delete_webhook(project_id, webhook_id)
+    return {
+        "status": "success",
+        "message": "Webhook deleted"
+    }
+
+
+def _tool_get_documents(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    vault_id = arguments.get("vault_id")
+    docs = client.get_documents(project_id, vault_id)
+    return {
+        "status": "success",
+        "documents": docs,
+        "count": len(docs)
+    }
+
+
+def _tool_get_document(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    document_id = arguments.get("document_id")
+    doc = client.get_document(project_id, document_id)
+    return {
+        "status": "success",
+        "document": doc
+    }
+
+
+def _tool_create_document(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    vault_id = arguments.get("vault_id")
+    title = arguments.get("title")
+    content = arguments.get("content")
+    doc = client.create_document(project_id, vault_id, title, content)
+    return {
+        "status": "success",
+        "document": doc
+    }
+
+
+def _tool_update_document(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    document_id = arguments.get("document_id")
+    title = arguments.get("title")
+    content = arguments.get("content")
+    doc = client.update_document(project_id, document_id, title, content)
+    return {
+        "status": "success",
+        "document": doc
+    }
+
+
+def _tool_trash_document(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    document_id = arguments.get("document_id")
+    client.trash_document(project_id, document_id)
+    return {
+        "status": "success",
+        "message": "Document trashed"
+    }
+
+
+# Timeline tools
+def _tool_get_timeline(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    page = arguments.get("page", 1)
+    if arguments.get("auto_paginate"):
+        events = client.fetch_pages(client.get_timeline, page, _max_pages(arguments))
+    else:
+        events = client.get_timeline(page)
+    return {
+        "status": "success",
+        "events": events,
+        "count": len(events),
+        "page": page
+    }
+
+
+def _tool_get_project_timeline(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    project_id = arguments.get("project_id")
+    page = arguments.get("page", 1)
+    events = client.get_project_timeline(project_id, page)
+    return {
+        "status": "success",
+        "events": events,
+        "count": len(events),
+        "page": page
+    }
+
+
+def _tool_get_person_timeline(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    person_id = arguments.get("person_id")
+    page = arguments.get("page", 1)
+    result = client.get_person_timeline(person_id, page)
+    events = result.get("events", [])
+    return {
+        "status": "success",
+        "person": result.get("person"),
+        "events": events,
+        "count": len(events),
+        "page": page
+    }
+
+
+# Report tools
+def _tool_get_todo_assignees(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    people = client.get_todo_assignees()
+    return {
+        "status": "success",
+        "people": people,
+        "count": len(people)
+    }
+
+
+def _tool_get_person_todos(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    person_id = arguments.get("person_id")
+    group_by = arguments.get("group_by", "bucket")
+    result = client.get_person_todos(person_id, group_by)
+    todos = result.get("todos", [])
+    return {
+        "status": "success",
+        "person": result.get("person"),
+        "grouped_by": result.get("grouped_by"),
+        "todos": todos,
+        "count": len(todos)
+    }
+
+
+def _tool_get_overdue_todos(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    result = client.get_overdue_todos()
+    return {
+        "status": "success",
+        "overdue_todos": result
+    }
+
+
+def _tool_get_upcoming_schedule(client: BasecampClient, arguments: dict[str, Any]) -> dict[str, Any]:
+    window_starts_on = arguments.get("window_starts_on")
+    window_ends_on = arguments.get("window_ends_on")
+    result = client.get_upcoming_schedule(window_starts_on, window_ends_on)
+    return {
+        "status": "success",
+        "schedule_entries": result.get("schedule_entries", []),
+        "recurring_schedule_entry_occurrences": result.get("recurring_schedule_entry_occurrences", []),
+        "assignables": result.get("assignables", [])
+    }
+
+
+# Tool name -> implementation, used by MCPServer._execute_tool
+_TOOL_HANDLERS = {
+    "get_projects": _tool_get_projects,
+    "get_project": _tool_get_project,
+    "get_todolists": _tool_get_todolists,
+    "get_todos": _tool_get_todos,
+    "create_todo": _tool_create_todo,
+    "update_todo": _tool_update_todo,
+    "delete_todo": _tool_delete_todo,
+    "complete_todo": _tool_complete_todo,
+    "uncomplete_todo": _tool_uncomplete_todo,
+    "search_basecamp": _tool_search_basecamp,
+    "global_search": _tool_global_search,
+    "get_comments": _tool_get_comments,
+    "create_comment": _tool_create_comment,
+    "get_campfire_lines": _tool_get_campfire_lines,
+    "get_daily_check_ins": _tool_get_daily_check_ins,
+    "get_question_answers": _tool_get_question_answers,
+    "get_card_tables": _tool_get_card_tables,
+    "get_card_table": _tool_get_card_table,
+    "get_columns": _tool_get_columns,
+    "get_column": _tool_get_column,
+    "create_column": _tool_create_column,
+    "update_column": _tool_update_column,
+    "move_column": _tool_move_column,
+    "update_column_color": _tool_update_column_color,
+    "put_column_on_hold": _tool_put_column_on_hold,
+    "remove_column_hold": _tool_remove_column_hold,
+    "watch_column": _tool_watch_column,
+    "unwatch_column": _tool_unwatch_column,
+    "get_cards": _tool_get_cards,
+    "get_card": _tool_get_card,
+    "create_card": _tool_create_card,
+    "update_card": _tool_update_card,
+    "move_card": _tool_move_card,
+    "complete_card": _tool_complete_card,
+    "uncomplete_card": _tool_uncomplete_card,
+    "get_card_steps": _tool_get_card_steps,
+    "create_card_step": _tool_create_card_step,
+    "get_card_step": _tool_get_card_step,
+    "update_card_step": _tool_update_card_step,
+    "delete_card_step": _tool_delete_card_step,
+    "complete_card_step": _tool_complete_card_step,
+    "uncomplete_card_step": _tool_uncomplete_card_step,
+    "create_attachment": _tool_create_attachment,
+    "get_events": _tool_get_events,
+    "get_recordings": _tool_get_recordings,
+    "get_webhooks": _tool_get_webhooks,
+    "create_webhook": _tool_create_webhook,
+    "delete_webhook": _tool_delete_webhook,
+    "get_documents": _tool_get_documents,
+    "get_document": _tool_get_document,
+    "create_document": _tool_create_document,
+    "update_document": _tool_update_document,
+    "trash_document": _tool_trash_document,
+    "get_timeline": _tool_get_timeline,
+    "get_project_timeline": _tool_get_project_timeline,
+    "get_person_timeline": _tool_get_person_timeline,
+    "get_todo_assignees": _tool_get_todo_assignees,
+    "get_person_todos": _tool_get_person_todos,
+    "get_overdue_todos": _tool_get_overdue_todos,
+    "get_upcoming_schedule": _tool_get_upcoming_schedule,
+}
+
+
+class MCPServer:
+    """MCP server implementing the Model Context Protocol for Cursor."""
+
+    __slots__ = ("tools", "_cached_client", "_client_valid_until", "_responses")
+
+    def __init__(self):
+        self.tools = _TOOLS
+        # (access_token, account_id, user_agent) and the client built for them
+        self._cached_client: tuple | None = None
+        self._client_valid_until = 0.0
+        # (tool_name, sorted arguments) -> (expiry, result) for _READ_ONLY_TOOLS
+        self._responses: dict[tuple, tuple] = {}
+        logger.info("MCP CLI Server initialized")
+
+    def _get_basecamp_client(self) -> tuple[BasecampClient | None, str | None]:
+        """Get authenticated Basecamp client.
+
+        Returns (client, None), or (None, reason) with a key of _AUTH_ERRORS
+        when no client can be built. A client built or confirmed within the
+        last _CLIENT_TTL seconds is returned without touching token storage.
+        """
+        if self._cached_client is not None and time.monotonic() < self._client_valid_until:
+            return self._cached_client[1], None
+
+        _load_env_once()
+        auth_manager = _lazy("auth_manager")
+        token_storage = _lazy("token_storage")
+        BasecampClient = _lazy("BasecampClient")
 
-    def _get_basecamp_client(self) -> Optional[BasecampClient]:
-        """Get authenticated Basecamp client."""
         try:
             token_data = token_storage.get_token()
-            logger.debug(f"Token data retrieved: {token_data}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Token data retrieved: {token_data}")
 
             if not token_data or not token_data.get('access_token'):
                 logger.error("No OAuth token available")
-                return None
+                return None, "unauth"
 
             # Check and automatically refresh if token is expired
             if not auth_manager.ensure_authenticated():
                 logger.error("OAuth token has expired and automatic refresh failed")
-                return None
+                return None, "expired"
 
             # Get fresh token data after potential refresh
             token_data = token_storage.get_token()
 
             # Get account_id from token data first, then fall back to env var
-            account_id = token_data.get('account_id') or os.getenv('BASECAMP_ACCOUNT_ID')
-
-            # Set a default user agent if none is provided
-            user_agent = os.getenv('USER_AGENT') or "Basecamp MCP Server (cursor@example.com)"
+            account_id = token_data.get('account_id') or _env_account_id
+            user_agent = _user_agent
 
             if not account_id:
-                logger.error(f"Missing account_id. Token data: {token_data}, Env BASECAMP_ACCOUNT_ID: {os.getenv('BASECAMP_ACCOUNT_ID')}")
-                return None
+                logger.error(f"Missing account_id. Token data: {token_data}, Env BASECAMP_ACCOUNT_ID: {_env_account_id}")
+                return None, "no_account"
+
+            # Reuse the client while the token and account are unchanged
+            key = (token_data['access_token'], account_id, user_agent)
+            if self._cached_client is not None and self._cached_client[0] == key:
+                self._client_valid_until = time.monotonic() + _CLIENT_TTL
+                return self._cached_client[1], None
 
-            logger.debug(f"Creating Basecamp client with account_id: {account_id}, user_agent: {user_agent}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Creating Basecamp client with account_id: {account_id}, user_agent: {user_agent}")
 
-            return BasecampClient(
+            client = BasecampClient(
                 access_token=token_data['access_token'],
                 account_id=account_id,
                 user_agent=user_agent,
                 auth_mode='oauth'
             )
+            self._cached_client = (key, client)
+            self._responses.clear()  # Results may belong to another account
+            self._client_valid_until = time.monotonic() + _CLIENT_TTL
+            return client, None
         except Exception as e:
             logger.error(f"Error creating Basecamp client: {e}")
-            return None
+            return None, "unauth"
+
+    # JSON-RPC method handlers. Each takes the request params and returns the
+    # response result, or None for notifications that get no response.
 
-    def handle_request(self, request: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    def _handle_initialize(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {
+                "tools": {}
+            },
+            "serverInfo": {
+                "name": SERVER_NAME,
+                "version": SERVER_VERSION
+            }
+        }
+
+    def _handle_initialized(self, params: dict[str, Any]) -> None:
+        logger.info("Received initialized notification")
+        return None
+
+    def _handle_tools_list(self, params: dict[str, Any]) -> dict[str, Any]:
+        return _TOOLS_LIST_RESULT
+
+    def _handle_tools_call(self, params: dict[str, Any]) -> dict[str, Any]:
+        tool_name = params.get("name")
+        arguments = params.get("arguments", {})
+
+        result = self._execute_tool(tool_name, arguments)
+
+        return {
+            "content": [
+                {
+                    "type": "text",
+                    "text": _dumps_text(result)
+                }
+            ]
+        }
+
+    def _handle_list_offerings(self, params: dict[str, Any]) -> dict[str, Any]:
+        # Respond to Cursor's ListOfferings UI request
+        return _OFFERINGS_RESULT
+
+    def _handle_ping(self, params: dict[str, Any]) -> dict[str, Any]:
+        return {}
+
+    # Lowercased method name (and the aliases Cursor uses) -> handler
+    _METHOD_HANDLERS = {
+        "initialize": _handle_initialize,
+        "initialized": _handle_initialized,
+        "tools/list": _handle_tools_list,
+        "listtools": _handle_tools_list,
+        "tools/call": _handle_tools_call,
+        "toolscall": _handle_tools_call,
+        "listofferings": _handle_list_offerings,
+        "list_offerings": _handle_list_offerings,
+        "loffering": _handle_list_offerings,
+        "ping": _handle_ping,
+    }
+
+    def handle_request(self, request: dict[str, Any]) -> dict[str, Any] | None:
         """Handle an MCP request."""
         method = request.get("method")
         # Normalize method name for cursor compatibility
@@ -851,93 +2101,21 @@ class MCPServer:
         params = request.get("params", {})
         request_id = request.get("id")
 
-        logger.info(f"Handling request: {method}")
-
-        try:
-            if method_lower == "initialize":
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {
-                            "tools": {}
-                        },
-                        "serverInfo": {
-                            "name": "basecamp-mcp-server",
-                            "version": "1.0.0"
-                        }
-                    }
-                }
-
-            elif method_lower == "initialized":
-                # This is a notification, no response needed
-                logger.info("Received initialized notification")
-                return None
-
-            elif method_lower in ("tools/list", "listtools"):
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "tools": self.tools
-                    }
-                }
-
-            elif method_lower in ("tools/call", "toolscall"):
-                tool_name = params.get("name")
-                arguments = params.get("arguments", {})
-
-                result = self._execute_tool(tool_name, arguments)
-
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "content": [
-                            {
-                                "type": "text",
-                                "text": json.dumps(result, indent=2)
-                            }
-                        ]
-                    }
-                }
-
-            elif method_lower in ("listofferings", "list_offerings", "loffering"):
-                # Respond to Cursor's ListOfferings UI request
-                offerings = []
-                for tool in self.tools:
-                    offerings.append({
-                        "name": tool.get("name"),
-                        "displayName": tool.get("name"),
-                        "description": tool.get("description")
-                    })
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {
-                        "offerings": offerings
-                    }
-                }
-
-            elif method_lower == "ping":
-                # Handle ping requests
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "result": {}
-                }
+        logger.info("Handling request: %s", method)
 
-            else:
-                return {
-                    "jsonrpc": "2.0",
-                    "id": request_id,
-                    "error": {
-                        "code": -32601,
-                        "message": f"Method not found: {method}"
-                    }
+        handler = self._METHOD_HANDLERS.get(method_lower)
+        if handler is None:
+            return {
+                "jsonrpc": "2.0",
+                "id": request_id,
+                "error": {
+                    "code": -32601,
+                    "message": f"Method not found: {method}"
                 }
+            }
 
+        try:
+            result = handler(self, params)
         except Exception as e:
             logger.error(f"Error handling request: {e}")
             return {
@@ -949,743 +2127,113 @@ class MCPServer:
                 }
             }
 
-    def _execute_tool(self, tool_name: str, arguments: Dict[str, Any]) -> Dict[str, Any]:
-        """Execute a tool and return the result."""
-        client = self._get_basecamp_client()
-        if not client:
-            # Check if it's specifically a token expiration issue
-            if token_storage.is_token_expired():
-                return {
-                    "error": "OAuth token expired",
-                    "message": "Your Basecamp OAuth token has expired. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-                }
-            else:
-                return {
-                    "error": "Authentication required",
-                    "message": "Please authenticate with Basecamp first. Visit http://localhost:8000 to log in."
-                }
-
-        try:
-            if tool_name == "get_projects":
-                projects = client.get_projects()
-                return {
-                    "status": "success",
-                    "projects": projects,
-                    "count": len(projects)
-                }
-
-            elif tool_name == "get_project":
-                project_id = arguments.get("project_id")
-                project = client.get_project(project_id)
-                return {
-                    "status": "success",
-                    "project": project
-                }
-
-            elif tool_name == "get_todolists":
-                project_id = arguments.get("project_id")
-                todolists = client.get_todolists(project_id)
-                return {
-                    "status": "success",
-                    "todolists": todolists,
-                    "count": len(todolists)
-                }
-
-            elif tool_name == "get_todos":
-                todolist_id = arguments.get("todolist_id")
-                project_id = arguments.get("project_id")
-                todos = client.get_todos(project_id, todolist_id)
-                return {
-                    "status": "success",
-                    "todos": todos,
-                    "count": len(todos)
-                }
-
-            elif tool_name == "create_todo":
-                project_id = arguments.get("project_id")
-                todolist_id = arguments.get("todolist_id")
-                content = arguments.get("content")
-                description = arguments.get("description")
-                assignee_ids = arguments.get("assignee_ids")
-                completion_subscriber_ids = arguments.get("completion_subscriber_ids")
-                notify_arg = arguments.get("notify", False)
-                if isinstance(notify_arg, str):
-                    notify = notify_arg.strip().lower() in ("1", "true", "yes", "on")
-                else:
-                    notify = bool(notify_arg)
-                due_on = arguments.get("due_on")
-                starts_on = arguments.get("starts_on")
-                
-                todo = client.create_todo(
-                    project_id, todolist_id, content,
-                    description=description,
-                    assignee_ids=assignee_ids,
-                    completion_subscriber_ids=completion_subscriber_ids,
-                    notify=notify,
-                    due_on=due_on,
-                    starts_on=starts_on
-                )
-                return {
-                    "status": "success",
-                    "todo": todo,
-                    "message": f"Todo '{content}' created successfully"
-                }
-
-            elif tool_name == "update_todo":
-                project_id = arguments.get("project_id")
-                todo_id = arguments.get("todo_id")
-                content = arguments.get("content")
-                description = arguments.get("description")
-                assignee_ids = arguments.get("assignee_ids")
-                completion_subscriber_ids = arguments.get("completion_subscriber_ids")
-                due_on = arguments.get("due_on")
-                starts_on = arguments.get("starts_on")
-                notify = arguments.get("notify")
-                
-                todo = client.update_todo(
-                    project_id, todo_id,
-                    content=content,
-                    description=description,
-                    assignee_ids=assignee_ids,
-                    completion_subscriber_ids=completion_subscriber_ids,
-                    notify=notify,
-                    due_on=due_on,
-                    starts_on=starts_on
-                )
-                return {
-                    "status": "success",
-                    "todo": todo,
-                    "message": "Todo updated successfully"
-                }
-
-            elif tool_name == "delete_todo":
-                project_id = arguments.get("project_id")
-                todo_id = arguments.get("todo_id")
-                client.delete_todo(project_id, todo_id)
-                return {
-                    "status": "success",
-                    "message": "Todo deleted successfully"
-                }
-
-            elif tool_name == "complete_todo":
-                project_id = arguments.get("project_id")
-                todo_id = arguments.get("todo_id")
-                completion = client.complete_todo(project_id, todo_id)
-                return {
-                    "status": "success",
-                    "completion": completion,
-                    "message": "Todo marked as complete"
-                }
-
-            elif tool_name == "uncomplete_todo":
-                project_id = arguments.get("project_id")
-                todo_id = arguments.get("todo_id")
-                client.uncomplete_todo(project_id, todo_id)
-                return {
-                    "status": "success",
-                    "message": "Todo marked as incomplete"
-                }
-
-            elif tool_name == "search_basecamp":
-                query = arguments.get("query")
-                project_id = arguments.get("project_id")
-
-                search = BasecampSearch(client=client)
-                results = {}
-
-                if project_id:
-                    # Search within specific project
-                    results["todolists"] = search.search_todolists(query, project_id)
-                    results["todos"] = search.search_todos(query, project_id)
-                else:
-                    # Search across all projects
-                    results["projects"] = search.search_projects(query)
-                    results["todos"] = search.search_todos(query)
-                    results["messages"] = search.search_messages(query)
-
-                return {
-                    "status": "success",
-                    "query": query,
-                    "results": results
-                }
-
-            elif tool_name == "global_search":
-                query = arguments.get("query")
-                search = BasecampSearch(client=client)
-                results = search.global_search(query)
-                return {
-                    "status": "success",
-                    "query": query,
-                    "results": results
-                }
-
-            elif tool_name == "get_comments":
-                recording_id = arguments.get("recording_id")
-                project_id = arguments.get("project_id")
-                page = arguments.get("page", 1)
-                result = client.get_comments(project_id, recording_id, page)
-                return {
-                    "status": "success",
-                    "comments": result["comments"],
-                    "count": len(result["comments"]),
-                    "page": page,
-                    "total_count": result["total_count"],
-                    "next_page": result["next_page"]
-                }
-
-            elif tool_name == "create_comment":
-                recording_id = arguments.get("recording_id")
-                project_id = arguments.get("project_id")
-                content = arguments.get("content")
-                comment = client.create_comment(recording_id, project_id, content)
-                return {
-                    "status": "success",
-                    "comment": comment,
-                    "message": "Comment created successfully"
-                }
-
-            elif tool_name == "get_campfire_lines":
-                project_id = arguments.get("project_id")
-                campfire_id = arguments.get("campfire_id")
-                lines = client.get_campfire_lines(project_id, campfire_id)
-                return {
-                    "status": "success",
-                    "campfire_lines": lines,
-                    "count": len(lines)
-                }
-            elif tool_name == "get_daily_check_ins":
-                project_id = arguments.get("project_id")
-                page = arguments.get("page", 1)
-                if page is not None and not isinstance(page, int):
-                    page = 1
-                answers = client.get_daily_check_ins(project_id, page=page)
-                return {
-                    "status": "success",
-                    "campfire_lines": answers,
-                    "count": len(answers)
-                }
-            elif tool_name == "get_question_answers":
-                project_id = arguments.get("project_id")
-                question_id = arguments.get("question_id")
-                page = arguments.get("page", 1)
-                if page is not None and not isinstance(page, int):
-                    page = 1
-                answers = client.get_question_answers(project_id, question_id, page=page)
-                return {
-                    "status": "success",
-                    "campfire_lines": answers,
-                    "count": len(answers)
-                }
-            
-            # Card Table tools implementation
-            elif tool_name == "get_card_tables":
-                project_id = arguments.get("project_id")
-                card_tables = client.get_card_tables(project_id)
-                return {
-                    "status": "success",
-                    "card_tables": card_tables,
-                    "count": len(card_tables)
-                }
-
-            elif tool_name == "get_card_table":
-                project_id = arguments.get("project_id")
-                try:
-                    card_table = client.get_card_table(project_id)
-                    card_table_details = client.get_card_table_details(project_id, card_table['id'])
-                    return {
-                        "status": "success",
-                        "card_table": card_table_details
-                    }
-                except Exception as e:
-                    error_msg = str(e)
-                    return {
-                        "status": "error",
-                        "message": f"Error getting card table: {error_msg}",
-                        "debug": error_msg
-                    }
-
-            elif tool_name == "get_columns":
-                project_id = arguments.get("project_id")
-                card_table_id = arguments.get("card_table_id")
-                columns = client.get_columns(project_id, card_table_id)
-                return {
-                    "status": "success",
-                    "columns": columns,
-                    "count": len(columns)
-                }
-
-            elif tool_name == "get_column":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                column = client.get_column(project_id, column_id)
-                return {
-                    "status": "success",
-                    "column": column
-                }
-
-            elif tool_name == "create_column":
-                project_id = arguments.get("project_id")
-                card_table_id = arguments.get("card_table_id")
-                title = arguments.get("title")
-                column = client.create_column(project_id, card_table_id, title)
-                return {
-                    "status": "success",
-                    "column": column,
-                    "message": f"Column '{title}' created successfully"
-                }
-
-            elif tool_name == "update_column":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                title = arguments.get("title")
-                column = client.update_column(project_id, column_id, title)
-                return {
-                    "status": "success",
-                    "column": column,
-                    "message": "Column updated successfully"
-                }
-
-            elif tool_name == "move_column":
-                project_id = arguments.get("project_id")
-                card_table_id = arguments.get("card_table_id")
-                column_id = arguments.get("column_id")
-                position = arguments.get("position")
-                client.move_column(project_id, column_id, position, card_table_id)
-                return {
-                    "status": "success",
-                    "message": f"Column moved to position {position}"
-                }
-
-            elif tool_name == "update_column_color":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                color = arguments.get("color")
-                column = client.update_column_color(project_id, column_id, color)
-                return {
-                    "status": "success",
-                    "column": column,
-                    "message": f"Column color updated to {color}"
-                }
-
-            elif tool_name == "put_column_on_hold":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                client.put_column_on_hold(project_id, column_id)
-                return {
-                    "status": "success",
-                    "message": "Column put on hold"
-                }
-
-            elif tool_name == "remove_column_hold":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                client.remove_column_hold(project_id, column_id)
-                return {
-                    "status": "success",
-                    "message": "Column hold removed"
-                }
-
-            elif tool_name == "watch_column":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                client.watch_column(project_id, column_id)
-                return {
-                    "status": "success",
-                    "message": "Column notifications enabled"
-                }
-
-            elif tool_name == "unwatch_column":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                client.unwatch_column(project_id, column_id)
-                return {
-                    "status": "success",
-                    "message": "Column notifications disabled"
-                }
-
-            elif tool_name == "get_cards":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                cards = client.get_cards(project_id, column_id)
-                return {
-                    "status": "success",
-                    "cards": cards,
-                    "count": len(cards)
-                }
-
-            elif tool_name == "get_card":
-                project_id = arguments.get("project_id")
-                card_id = arguments.get("card_id")
-                card = client.get_card(project_id, card_id)
-                return {
-                    "status": "success",
-                    "card": card
-                }
-
-            elif tool_name == "create_card":
-                project_id = arguments.get("project_id")
-                column_id = arguments.get("column_id")
-                title = arguments.get("title")
-                content = arguments.get("content")
-                due_on = arguments.get("due_on")
-                notify = bool(arguments.get("notify", False))
-                card = client.create_card(project_id, column_id, title, content, due_on, notify)
-                return {
-                    "status": "success",
-                    "card": card,
-                    "message": f"Card '{title}' created successfully"
-                }
-
-            elif tool_name == "update_card":
-                project_id = arguments.get("project_id")
-                card_id = arguments.get("card_id")
-                title = arguments.get("title")
-                content = arguments.get("content")
-                due_on = arguments.get("due_on")
-                assignee_ids = arguments.get("assignee_ids")
-                card = client.update_card(project_id, card_id, title, content, due_on, assignee_ids)
-                return {
-                    "status": "success",
-                    "card": card,
-                    "message": "Card updated successfully"
-                }
-
-            elif tool_name == "move_card":
-                project_id = arguments.get("project_id")
-                card_id = arguments.get("card_id")
-                column_id = arguments.get("column_id")
-                client.move_card(project_id, card_id, column_id)
-                message = "Card moved"
-                if column_id:
-                    message = f"Card moved to column {column_id}"
-                return {
-                    "status": "success",
-                    "message": message
-                }
-            
-            elif tool_name == "complete_card":
-                project_id = arguments.get("project_id")
-                card_id = arguments.get("card_id")
-                client.complete_card(project_id, card_id)
-                return {
-                    "status": "success",
-                    "message": "Card marked as complete"
-                }
-
-            elif tool_name == "uncomplete_card":
-                project_id = arguments.get("project_id")
-                card_id = arguments.get("card_id")
-                client.uncomplete_card(project_id, card_id)
-                return {
-                    "status": "success",
-                    "message": "Card marked as incomplete"
-                }
-
-            elif tool_name == "get_card_steps":
-                project_id = arguments.get("project_id")
-                card_id = arguments.get("card_id")
-                steps = client.get_card_steps(project_id, card_id)
-                return {
-                    "status": "success",
-                    "steps": steps,
-                    "count": len(steps)
-                }
-
-            elif tool_name == "create_card_step":
-                project_id = arguments.get("project_id")
-                card_id = arguments.get("card_id")
-                title = arguments.get("title")
-                due_on = arguments.get("due_on")
-                assignee_ids = arguments.get("assignee_ids")
-                step = client.create_card_step(project_id, card_id, title, due_on, assignee_ids)
-                return {
-                    "status": "success",
-                    "step": step,
-                    "message": f"Step '{title}' created successfully"
-                }
-
-            elif tool_name == "get_card_step":
-                project_id = arguments.get("project_id")
-                step_id = arguments.get("step_id")
-                step = client.get_card_step(project_id, step_id)
-                return {
-                    "status": "success",
-                    "step": step
-                }
-
-            elif tool_name == "update_card_step":
-                project_id = arguments.get("project_id")
-                step_id = arguments.get("step_id")
-                title = arguments.get("title")
-                due_on = arguments.get("due_on")
-                assignee_ids = arguments.get("assignee_ids")
-                step = client.update_card_step(project_id, step_id, title, due_on, assignee_ids)
-                return {
-                    "status": "success",
-                    "step": step,
-                    "message": f"Step '{title}' updated successfully"
-                }
-
-            elif tool_name == "delete_card_step":
-                project_id = arguments.get("project_id")
-                step_id = arguments.get("step_id")
-                client.delete_card_step(project_id, step_id)
-                return {
-                    "status": "success",
-                    "message": "Step deleted successfully"
-                }
-
-            elif tool_name == "complete_card_step":
-                project_id = arguments.get("project_id")
-                step_id = arguments.get("step_id")
-                client.complete_card_step(project_id, step_id)
-                return {
-                    "status": "success",
-                    "message": "Step marked as complete"
-                }
-
-            elif tool_name == "uncomplete_card_step":
-                project_id = arguments.get("project_id")
-                step_id = arguments.get("step_id")
-                client.uncomplete_card_step(project_id, step_id)
-                return {
-                    "status": "success",
-                    "message": "Step marked as incomplete"
-                }
-
-            elif tool_name == "create_attachment":
-                file_path = arguments.get("file_path")
-                name = arguments.get("name")
-                content_type = arguments.get("content_type", "application/octet-stream")
-                result = client.create_attachment(file_path, name, content_type)
-                return {
-                    "status": "success",
-                    "attachment": result
-                }
-
-            elif tool_name == "get_events":
-                project_id = arguments.get("project_id")
-                recording_id = arguments.get("recording_id")
-                page = arguments.get("page", 1)
-                events = client.get_events(project_id, recording_id, page)
-                return {
-                    "status": "success",
-                    "events": events,
-                    "count": len(events)
-                }
-
-            elif tool_name == "get_recordings":
-                type_ = arguments.get("type")
-                bucket = arguments.get("bucket")
-                status = arguments.get("status", "active")
-                sort = arguments.get("sort", "created_at")
-                direction = arguments.get("direction", "desc")
-                page = arguments.get("page", 1)
-                recordings = client.get_recordings(type_, bucket, status, sort, direction, page)
-                return {
-                    "status": "success",
-                    "recordings": recordings,
-                    "count": len(recordings)
-                }
-
-            elif tool_name == "get_webhooks":
-                project_id = arguments.get("project_id")
-                hooks = client.get_webhooks(project_id)
-                return {
-                    "status": "success",
-                    "webhooks": hooks,
-                    "count": len(hooks)
-                }
-
-            elif tool_name == "create_webhook":
-                project_id = arguments.get("project_id")
-                payload_url = arguments.get("payload_url")
-                types = arguments.get("types")
-                hook = client.create_webhook(project_id, payload_url, types)
-                return {
-                    "status": "success",
-                    "webhook": hook
-                }
-
-            elif tool_name == "delete_webhook":
-                project_id = arguments.get("project_id")
-                webhook_id = arguments.get("webhook_id")
-                client.delete_webhook(project_id, webhook_id)
-                return {
-                    "status": "success",
-                    "message": "Webhook deleted"
-                }
-
-            elif tool_name == "get_documents":
-                project_id = arguments.get("project_id")
-                vault_id = arguments.get("vault_id")
-                docs = client.get_documents(project_id, vault_id)
-                return {
-                    "status": "success",
-                    "documents": docs,
-                    "count": len(docs)
-                }
-
-            elif tool_name == "get_document":
-                project_id = arguments.get("project_id")
-                document_id = arguments.get("document_id")
-                doc = client.get_document(project_id, document_id)
-                return {
-                    "status": "success",
-                    "document": doc
-                }
-
-            elif tool_name == "create_document":
-                project_id = arguments.get("project_id")
-                vault_id = arguments.get("vault_id")
-                title = arguments.get("title")
-                content = arguments.get("content")
-                doc = client.create_document(project_id, vault_id, title, content)
-                return {
-                    "status": "success",
-                    "document": doc
-                }
-
-            elif tool_name == "update_document":
-                project_id = arguments.get("project_id")
-                document_id = arguments.get("document_id")
-                title = arguments.get("title")
-                content = arguments.get("content")
-                doc = client.update_document(project_id, document_id, title, content)
-                return {
-                    "status": "success",
-                    "document": doc
-                }
-
-            elif tool_name == "trash_document":
-                project_id = arguments.get("project_id")
-                document_id = arguments.get("document_id")
-                client.trash_document(project_id, document_id)
-                return {
-                    "status": "success",
-                    "message": "Document trashed"
-                }
-
-            # Timeline tools
-            elif tool_name == "get_timeline":
-                page = arguments.get("page", 1)
-                events = client.get_timeline(page)
-                return {
-                    "status": "success",
-                    "events": events,
-                    "count": len(events),
-                    "page": page
-                }
-
-            elif tool_name == "get_project_timeline":
-                project_id = arguments.get("project_id")
-                page = arguments.get("page", 1)
-                events = client.get_project_timeline(project_id, page)
-                return {
-                    "status": "success",
-                    "events": events,
-                    "count": len(events),
-                    "page": page
-                }
-
-            elif tool_name == "get_person_timeline":
-                person_id = arguments.get("person_id")
-                page = arguments.get("page", 1)
-                result = client.get_person_timeline(person_id, page)
-                return {
-                    "status": "success",
-                    "person": result.get("person"),
-                    "events": result.get("events", []),
-                    "count": len(result.get("events", [])),
-                    "page": page
-                }
-
-            # Report tools
-            elif tool_name == "get_todo_assignees":
-                people = client.get_todo_assignees()
-                return {
-                    "status": "success",
-                    "people": people,
-                    "count": len(people)
-                }
+        if result is None:
+            # Notification, no response needed
+            return None
+        return {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "result": result
+        }
+
+    def _invalidate(self, tools: frozenset[str], project_id: str | None) -> None:
+        """Drop cached results of tools that are unscoped or for project_id."""
+        stale = [
+            key for key in self._responses
+            if key[0] in tools
+            and (project_id is None or str(dict(key[1]).get("project_id", project_id)) == str(project_id))
+        ]
+        for key in stale:
+            del self._responses[key]
 
-            elif tool_name == "get_person_todos":
-                person_id = arguments.get("person_id")
-                group_by = arguments.get("group_by", "bucket")
-                result = client.get_person_todos(person_id, group_by)
-                return {
-                    "status": "success",
-                    "person": result.get("person"),
-                    "grouped_by": result.get("grouped_by"),
-                    "todos": result.get("todos", []),
-                    "count": len(result.get("todos", []))
-                }
+    def _execute_tool(self, tool_name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+        """Execute a tool and return the result."""
+        client, reason = self._get_basecamp_client()
+        if client is None:
+            return _AUTH_ERRORS[reason]
 
-            elif tool_name == "get_overdue_todos":
-                result = client.get_overdue_todos()
-                return {
-                    "status": "success",
-                    "overdue_todos": result
-                }
+        handler = _TOOL_HANDLERS.get(tool_name)
+        if handler is None:
+            return {
+                "error": "Unknown tool",
+                "message": f"Tool '{tool_name}' is not supported"
+            }
 
-            elif tool_name == "get_upcoming_schedule":
-                window_starts_on = arguments.get("window_starts_on")
-                window_ends_on = arguments.get("window_ends_on")
-                result = client.get_upcoming_schedule(window_starts_on, window_ends_on)
-                return {
-                    "status": "success",
-                    "schedule_entries": result.get("schedule_entries", []),
-                    "recurring_schedule_entry_occurrences": result.get("recurring_schedule_entry_occurrences", []),
-                    "assignables": result.get("assignables", [])
-                }
+        missing = [name for name in _REQUIRED_ARGS[tool_name] if arguments.get(name) is None]
+        if missing:
+            return {
+                "error": "Invalid arguments",
+                "message": f"Missing required argument(s) for '{tool_name}': {', '.join(missing)}"
+            }
 
+        arguments = _coerce_arguments(tool_name, arguments)
+        if tool_name not in _READ_ONLY_TOOLS:
+            stale_tools = _INVALIDATES.get(tool_name)
+            if stale_tools and self._responses:
+                self._invalidate(stale_tools, arguments.get("project_id"))
+            cache_key = None
+        else:
+            try:
+                cache_key = (tool_name, tuple(sorted(arguments.items())))
+                expires, result = self._responses[cache_key]
+            except KeyError:
+                pass
+            except TypeError:
+                cache_key = None  # Unhashable argument values, don't cache
             else:
-                return {
-                    "error": "Unknown tool",
-                    "message": f"Tool '{tool_name}' is not supported"
-                }
+                if time.monotonic() < expires:
+                    return result
+                del self._responses[cache_key]
 
+        from basecamp_client import TokenExpiredError
+
+        try:
+            result = handler(client, arguments)
+        except TokenExpiredError as e:
+            logger.error(f"Error executing tool {tool_name}: {e}")
+            self._cached_client = None
+            return {
+                "error": "OAuth token expired",
+                "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
+            }
         except Exception as e:
             logger.error(f"Error executing tool {tool_name}: {e}")
-            # Check if it's a 401 error (token expired during API call)
-            if "401" in str(e) and "expired" in str(e).lower():
-                return {
-                    "error": "OAuth token expired",
-                    "message": "Your Basecamp OAuth token expired during the API call. Please re-authenticate by visiting http://localhost:8000 and completing the OAuth flow again."
-                }
             return {
                 "error": "Execution error",
                 "message": str(e)
             }
 
+        if cache_key is not None and result.get("status") == "success":
+            if len(self._responses) >= _RESPONSE_CACHE_SIZE:
+                # Drop the oldest entry; dicts keep insertion order
+                del self._responses[next(iter(self._responses))]
+            self._responses[cache_key] = (time.monotonic() + _RESPONSE_TTL, result)
+        return result
+
     def run(self):
-        """Run the MCP server, reading from stdin and writing to stdout."""
+        """Run the MCP server, reading from stdin and writing to stdout.
+
+        Messages are read and written as raw bytes, skipping the text layer's
+        decode/encode; both JSON backends accept bytes directly.
+        """
         logger.info("Starting MCP CLI server")
 
-        for line in sys.stdin:
+        for line in sys.stdin.buffer:
             try:
                 line = line.strip()
                 if not line:
                     continue
 
-                request = json.loads(line)
+                request = _loads(line)
                 response = self.handle_request(request)
 
                 # Write response to stdout (only if there's a response)
                 if response is not None:
-                    print(json.dumps(response), flush=True)
+                    _write_message(_encode_response(response))
 
             except json.JSONDecodeError as e:
                 logger.error(f"Invalid JSON received: {e}")
-                error_response = {
-                    "jsonrpc": "2.0",
-                    "id": None,
-                    "error": {
-                        "code": -32700,
-                        "message": "Parse error"
-                    }
-                }
-                print(json.dumps(error_response), flush=True)
+                _write_message(_PARSE_ERROR_RESPONSE)
 
             except Exception as e:
                 logger.error(f"Unexpected error: {e}")
@@ -1697,8 +2245,21 @@ class MCPServer:
                         "message": f"Internal error: {str(e)}"
                     }
                 }
-                print(json.dumps(error_response), flush=True)
+                _write_message(_dumpb(error_response))
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point: answer --help/--version directly, otherwise serve stdin/stdout."""
+    args = sys.argv[1:] if argv is None else argv
+    if "-h" in args or "--help" in args:
+        print(USAGE, end="")
+        return 0
+    if "--version" in args:
+        print(f"{SERVER_NAME} {SERVER_VERSION}")
+        return 0
 
-if __name__ == "__main__":
     server = MCPServer()
     server.run()
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,181 @@
+"""Tests for BasecampClient request helpers."""
+
+import json
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from basecamp_client import (
+    MAX_FETCH_PAGES, BasecampClient, TokenExpiredError, _FETCH_BATCH_SIZE, _geared_page_size,
+)
+
+
+def _client():
+    return BasecampClient(
+        access_token='test_token',
+        account_id='12345',
+        user_agent='Test Agent',
+        auth_mode='oauth'
+    )
+
+
+def _pages(*sizes):
+    """Fake paginated endpoint returning pages of the given sizes."""
+    calls = []
+    lock = threading.Lock()
+
+    def fetch_page(page):
+        with lock:
+            calls.append(page)
+        if page > len(sizes):
+            return []
+        start = sum(sizes[:page - 1])
+        return list(range(start, start + sizes[page - 1]))
+
+    return fetch_page, calls
+
+
+class TestFetchPages:
+    def test_short_first_page_fetches_nothing_else(self):
+        fetch_page, calls = _pages(10)
+        assert _client().fetch_pages(fetch_page) == list(range(10))
+        assert calls == [1]
+
+    def test_concatenates_pages_in_order(self):
+        fetch_page, calls = _pages(15, 30, 5)
+        result = _client().fetch_pages(fetch_page, max_pages=5)
+        assert result == list(range(50))
+        assert calls[0] == 1
+        assert set(calls) <= {1, 2, 3, 4, 5}
+
+    def test_respects_max_pages(self):
+        fetch_page, calls = _pages(15, 30, 50, 100)
+        result = _client().fetch_pages(fetch_page, max_pages=2)
+        assert result == list(range(45))
+        assert sorted(calls) == [1, 2]
+
+    def test_starts_at_given_page(self):
+        fetch_page, calls = _pages(15, 30, 50, 100)
+        result = _client().fetch_pages(fetch_page, page=2, max_pages=2)
+        assert result == list(range(15, 95))
+        assert sorted(calls) == [2, 3]
+
+    def test_single_page_when_max_pages_is_one(self):
+        fetch_page, calls = _pages(15, 30)
+        assert _client().fetch_pages(fetch_page, max_pages=1) == list(range(15))
+        assert calls == [1]
+
+    def test_max_pages_is_capped_and_fetched_in_batches(self):
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+
+        def fetch_page(page):
+            with lock:
+                in_flight.append(page)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.remove(page)
+            return [page] * _geared_page_size(page)
+
+        result = _client().fetch_pages(fetch_page, max_pages=300)
+        assert len(peak) == MAX_FETCH_PAGES
+        assert max(peak) <= _FETCH_BATCH_SIZE
+        assert result[-1] == MAX_FETCH_PAGES
+
+    def test_stops_at_first_short_page(self):
+        fetch_page, calls = _pages(15, 30, 50, 10, 100, 100, 100, 100, 100, 100)
+        result = _client().fetch_pages(fetch_page, max_pages=10)
+        assert result == list(range(105))
+        # Pages after the batch holding the short page are never requested
+        assert max(calls) <= 1 + _FETCH_BATCH_SIZE
+
+
+def _response(status_code, body=None, etag=None):
+    response = Mock()
+    response.status_code = status_code
+    response.headers = {"ETag": etag} if etag else {}
+    response.json.return_value = body
+    response.content = json.dumps(body).encode() if body is not None else b""
+    response.encoding = "utf-8"
+    return response
+
+
+class TestConditionalGet:
+    @patch('requests.Session.get')
+    def test_not_modified_returns_cached_response(self, mock_get):
+        client = _client()
+        first = _response(200, [{"id": 1}], etag='W/"abc"')
+        mock_get.side_effect = [first, _response(304)]
+
+        assert client.get('projects.json') is first
+        cached = client.get('projects.json')
+        assert cached.status_code == 200
+        assert cached.json() == [{"id": 1}]
+        assert cached.headers["etag"] == 'W/"abc"'
+        assert mock_get.call_args[1]['headers']['If-None-Match'] == 'W/"abc"'
+
+    @patch('requests.Session.get')
+    def test_cache_keeps_only_body_and_headers(self, mock_get):
+        client = _client()
+        mock_get.return_value = _response(200, [1], etag='"e"')
+
+        client.get('projects.json')
+        (entry,) = client._etag_cache.values()
+        assert entry == ('"e"', b'[1]', {"ETag": '"e"'}, "utf-8")
+
+    @patch('requests.Session.get')
+    def test_params_are_part_of_the_cache_key(self, mock_get):
+        client = _client()
+        mock_get.side_effect = [
+            _response(200, [1], etag='"p1"'),
+            _response(200, [2], etag='"p2"'),
+        ]
+
+        client.get('recordings.json', params={"page": 1})
+        client.get('recordings.json', params={"page": 2})
+        assert 'If-None-Match' not in mock_get.call_args[1]['headers']
+
+    @patch('requests.Session.get')
+    def test_responses_without_etag_are_not_cached(self, mock_get):
+        client = _client()
+        mock_get.side_effect = [_response(200, [1]), _response(200, [2])]
+
+        client.get('projects.json')
+        assert client.get('projects.json').json() == [2]
+        assert 'If-None-Match' not in mock_get.call_args[1]['headers']
+
+
+class TestTokenExpired:
+    @patch('requests.Session.get')
+    def test_expired_token_raises(self, mock_get):
+        response = _response(401)
+        response.headers = {"WWW-Authenticate": 'Bearer realm="Basecamp", error="invalid_token"'}
+        response.text = "OAuth token expired (old age)"
+        mock_get.return_value = response
+
+        with pytest.raises(TokenExpiredError):
+            _client().get('projects.json')
+
+    @patch('requests.Session.post')
+    def test_other_unauthorized_responses_are_returned(self, mock_post):
+        response = _response(401)
+        response.text = "Access denied"
+        mock_post.return_value = response
+
+        assert _client().post('projects.json', {}) is response
+
+
+class TestSession:
+    def test_https_adapter_pools_and_retries_idempotent_requests(self):
+        from basecamp_client import _session
+
+        adapter = _session.get_adapter('https://3.basecampapi.com/')
+        retry = adapter.max_retries
+        assert adapter._pool_maxsize == 20
+        assert 429 in retry.status_forcelist
+        assert retry.is_retry('GET', 503)
+        assert not retry.is_retry('POST', 503)
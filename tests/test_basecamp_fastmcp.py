@@ -0,0 +1,51 @@
+"""Tests for the FastMCP server helpers."""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import basecamp_fastmcp
+
+
+class _SlowClient:
+    """Stand-in client whose get_document takes long enough to overlap."""
+
+    def __init__(self, access_token="test_token"):
+        self.account_id = "12345"
+        self.access_token = access_token
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_document(self, project_id, document_id):
+        with self._lock:
+            self.calls.append((project_id, document_id))
+        time.sleep(0.05)
+        return {"id": document_id}
+
+
+def _get_documents_concurrently(clients):
+    async def run():
+        return await asyncio.gather(
+            basecamp_fastmcp.get_document("1", "2"),
+            basecamp_fastmcp.get_document("1", "2"),
+        )
+
+    with patch.object(basecamp_fastmcp, "_get_basecamp_client", side_effect=clients):
+        return asyncio.run(run())
+
+
+def test_concurrent_identical_reads_share_one_request():
+    # Separate client objects for the same token, as after a client rebuild
+    first, second = _SlowClient(), _SlowClient()
+    results = _get_documents_concurrently([first, second])
+
+    assert [r["document"] for r in results] == [{"id": "2"}, {"id": "2"}]
+    assert len(first.calls) + len(second.calls) == 1
+
+
+def test_reads_for_different_tokens_are_not_shared():
+    first, second = _SlowClient("token_a"), _SlowClient("token_b")
+    _get_documents_concurrently([first, second])
+
+    assert len(first.calls) == len(second.calls) == 1
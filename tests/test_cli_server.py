@@ -4,261 +4,330 @@
 import json
 import subprocess
 import sys
+import threading
 import time
 import pytest
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 import token_storage
 
-def test_cli_server_initialize():
-    """Test that the CLI server responds to initialize requests."""
-    # Create a mock request
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {}
-    }
-
-    # Start the CLI server process
+@pytest.fixture(scope="module")
+def cli_server():
+    """One CLI server process shared by the JSON-RPC tests in this module."""
     proc = subprocess.Popen(
         [sys.executable, "mcp_server_cli.py"],
         stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+        stderr=subprocess.DEVNULL,
+        text=True,
+        bufsize=1
     )
-
+    yield proc
+    proc.stdin.close()
     try:
-        # Send the request
-        stdout, stderr = proc.communicate(
-            input=json.dumps(request) + "\n",
-            timeout=10
-        )
-
-        # Parse the response
-        response = json.loads(stdout.strip())
-
-        # Check the response
-        assert response["jsonrpc"] == "2.0"
-        assert response["id"] == 1
-        assert "result" in response
-        assert "protocolVersion" in response["result"]
-        assert "capabilities" in response["result"]
-        assert "serverInfo" in response["result"]
-
+        proc.wait(timeout=5)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+
+def _call(proc, request, timeout=10):
+    """Send one request to the server and return its parsed response."""
+    proc.stdin.write(json.dumps(request) + "\n")
+    proc.stdin.flush()
+    # Kill the server rather than hang if it doesn't answer in time
+    watchdog = threading.Timer(timeout, proc.kill)
+    watchdog.start()
+    try:
+        line = proc.stdout.readline()
     finally:
-        if proc.poll() is None:
-            proc.terminate()
+        watchdog.cancel()
+    assert line, "CLI server exited without responding"
+    return json.loads(line)
 
-def test_cli_server_tools_list():
-    """Test that the CLI server returns available tools."""
-    # Create requests
-    init_request = {
+def test_cli_server_initialize(cli_server):
+    """Test that the CLI server responds to initialize requests."""
+    response = _call(cli_server, {
         "jsonrpc": "2.0",
         "id": 1,
         "method": "initialize",
         "params": {}
-    }
+    })
+
+    # Check the response
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == 1
+    assert "result" in response
+    assert "protocolVersion" in response["result"]
+    assert "capabilities" in response["result"]
+    assert "serverInfo" in response["result"]
 
-    tools_request = {
+def test_cli_server_tools_list(cli_server):
+    """Test that the CLI server returns available tools."""
+    tools_response = _call(cli_server, {
         "jsonrpc": "2.0",
         "id": 2,
         "method": "tools/list",
         "params": {}
-    }
+    })
 
-    # Start the CLI server process
-    proc = subprocess.Popen(
-        [sys.executable, "mcp_server_cli.py"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    assert tools_response["jsonrpc"] == "2.0"
+    assert tools_response["id"] == 2
+    assert "result" in tools_response
+    assert "tools" in tools_response["result"]
 
-    try:
-        # Send both requests
-        input_data = json.dumps(init_request) + "\n" + json.dumps(tools_request) + "\n"
-        stdout, stderr = proc.communicate(
-            input=input_data,
-            timeout=10
-        )
-
-        # Parse responses (we get two lines)
-        lines = stdout.strip().split('\n')
-        assert len(lines) >= 2
-
-        # Check the tools list response (second response)
-        tools_response = json.loads(lines[1])
-
-        assert tools_response["jsonrpc"] == "2.0"
-        assert tools_response["id"] == 2
-        assert "result" in tools_response
-        assert "tools" in tools_response["result"]
-
-        tools = tools_response["result"]["tools"]
-        assert isinstance(tools, list)
-        assert len(tools) > 0
-
-        # Check that expected tools are present
-        tool_names = [tool["name"] for tool in tools]
-        expected_tools = ["get_projects", "search_basecamp", "get_todos", "global_search", "create_comment"]
-        for expected_tool in expected_tools:
-            assert expected_tool in tool_names
+    tools = tools_response["result"]["tools"]
+    assert isinstance(tools, list)
+    assert len(tools) > 0
 
-    finally:
-        if proc.poll() is None:
-            proc.terminate()
+    # Check that expected tools are present
+    tool_names = [tool["name"] for tool in tools]
+    expected_tools = ["get_projects", "search_basecamp", "get_todos", "global_search", "create_comment"]
+    for expected_tool in expected_tools:
+        assert expected_tool in tool_names
 
-@patch.object(token_storage, 'get_token')
-def test_cli_server_tool_call_no_auth(mock_get_token):
+def test_cli_server_tool_call_no_auth(cli_server):
     """Test tool call when not authenticated."""
-    # Note: The mock doesn't work across processes, so this test checks
-    # that the CLI server handles authentication errors gracefully
-
-    # Create requests
-    init_request = {
+    # Note: token_storage can't be mocked across processes, so this test
+    # checks that the CLI server handles authentication errors gracefully
+    tool_response = _call(cli_server, {
         "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {}
-    }
-
-    tool_request = {
-        "jsonrpc": "2.0",
-        "id": 2,
+        "id": 3,
         "method": "tools/call",
         "params": {
             "name": "get_projects",
             "arguments": {}
         }
-    }
-
-    # Start the CLI server process
-    proc = subprocess.Popen(
-        [sys.executable, "mcp_server_cli.py"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
-
-    try:
-        # Send both requests
-        input_data = json.dumps(init_request) + "\n" + json.dumps(tool_request) + "\n"
-        stdout, stderr = proc.communicate(
-            input=input_data,
-            timeout=10
-        )
-
-        # Parse responses
-        lines = stdout.strip().split('\n')
-        assert len(lines) >= 2
+    })
 
-        # Check the tool call response (second response)
-        tool_response = json.loads(lines[1])
+    assert tool_response["jsonrpc"] == "2.0"
+    assert tool_response["id"] == 3
+    assert "result" in tool_response
+    assert "content" in tool_response["result"]
 
-        assert tool_response["jsonrpc"] == "2.0"
-        assert tool_response["id"] == 2
-        assert "result" in tool_response
-        assert "content" in tool_response["result"]
+    # The content should contain some kind of response (either data or error)
+    content_text = tool_response["result"]["content"][0]["text"]
+    content_data = json.loads(content_text)
 
-        # The content should contain some kind of response (either data or error)
-        content_text = tool_response["result"]["content"][0]["text"]
-        content_data = json.loads(content_text)
-
-        # Since we have valid OAuth tokens, this might succeed or fail
-        # We just check that we get a valid JSON response
-        assert isinstance(content_data, dict)
-
-    finally:
-        if proc.poll() is None:
-            proc.terminate()
+    # Since we have valid OAuth tokens, this might succeed or fail
+    # We just check that we get a valid JSON response
+    assert isinstance(content_data, dict)
 
 @pytest.mark.skip(reason="Flaky: times out waiting for CLI server subprocess to respond")
-@patch.object(token_storage, 'get_token')
-def test_cli_server_global_search_call_no_auth(mock_get_token):
+def test_cli_server_global_search_call_no_auth(cli_server):
     """Test global search tool call without authentication."""
-    init_request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {}
-    }
-
-    tool_request = {
+    tool_response = _call(cli_server, {
         "jsonrpc": "2.0",
-        "id": 2,
+        "id": 4,
         "method": "tools/call",
         "params": {
             "name": "global_search",
             "arguments": {"query": "test"}
         }
-    }
+    })
 
-    proc = subprocess.Popen(
-        [sys.executable, "mcp_server_cli.py"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
+    assert tool_response["jsonrpc"] == "2.0"
+    assert tool_response["id"] == 4
+    assert "result" in tool_response
+    assert "content" in tool_response["result"]
+
+def test_cli_server_invalid_method(cli_server):
+    """Test that the CLI server handles invalid methods."""
+    response = _call(cli_server, {
+        "jsonrpc": "2.0",
+        "id": 5,
+        "method": "invalid_method",
+        "params": {}
+    })
+
+    # Check the error response
+    assert response["jsonrpc"] == "2.0"
+    assert response["id"] == 5
+    assert "error" in response
+    assert response["error"]["code"] == -32601  # Method not found
+
+def test_cli_server_version():
+    """Test that --version answers without starting the server."""
+    result = subprocess.run(
+        [sys.executable, "mcp_server_cli.py", "--version"],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        timeout=10
     )
 
-    try:
-        input_data = json.dumps(init_request) + "\n" + json.dumps(tool_request) + "\n"
-        stdout, stderr = proc.communicate(
-            input=input_data,
-            timeout=10
-        )
+    assert result.returncode == 0
+    assert result.stdout.strip() == "basecamp-mcp-server 1.0.0"
 
-        lines = stdout.strip().split('\n')
-        assert len(lines) >= 2
+@patch('auth_manager.ensure_authenticated', return_value=True)
+@patch.object(token_storage, 'get_token')
+def test_cli_server_reuses_client(mock_get_token, mock_auth):
+    """Test that the Basecamp client is reused until the token changes."""
+    from mcp_server_cli import MCPServer
+
+    mock_get_token.return_value = {'access_token': 'test_token', 'account_id': '12345'}
+    server = MCPServer()
+    client, _ = server._get_basecamp_client()
+    assert client is not None
+    reads = mock_get_token.call_count
+    assert server._get_basecamp_client()[0] is client
+    assert mock_get_token.call_count == reads  # token not re-read within the TTL
+
+    server._client_valid_until = 0.0  # TTL elapsed
+    assert server._get_basecamp_client()[0] is client
+
+    server._client_valid_until = 0.0
+    mock_get_token.return_value = {'access_token': 'new_token', 'account_id': '12345'}
+    assert server._get_basecamp_client()[0] is not client
+
+@patch('auth_manager.ensure_authenticated', return_value=True)
+@patch.object(token_storage, 'get_token')
+def test_cli_server_missing_required_arguments(mock_get_token, mock_auth):
+    """Test that required arguments are checked before calling Basecamp."""
+    from mcp_server_cli import MCPServer
 
-        tool_response = json.loads(lines[1])
+    mock_get_token.return_value = {'access_token': 'test_token', 'account_id': '12345'}
+    result = MCPServer()._execute_tool('get_card', {'project_id': '123'})
 
-        assert tool_response["jsonrpc"] == "2.0"
-        assert tool_response["id"] == 2
-        assert "result" in tool_response
-        assert "content" in tool_response["result"]
+    assert result['error'] == 'Invalid arguments'
+    assert 'card_id' in result['message']
+    assert 'project_id' not in result['message']
 
-    finally:
-        if proc.poll() is None:
-            proc.terminate()
+def test_cli_server_coerces_string_arguments():
+    """Test that boolean/integer arguments sent as strings follow the schema."""
+    from mcp_server_cli import _coerce_arguments
 
-def test_cli_server_invalid_method():
-    """Test that the CLI server handles invalid methods."""
-    request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "invalid_method",
-        "params": {}
-    }
+    arguments = {'project_id': '1', 'todolist_id': '2', 'content': 'x', 'notify': ' Yes '}
+    assert _coerce_arguments('create_todo', arguments)['notify'] is True
+    assert arguments['notify'] == ' Yes '  # caller's dict is not modified
 
-    # Start the CLI server process
-    proc = subprocess.Popen(
-        [sys.executable, "mcp_server_cli.py"],
-        stdin=subprocess.PIPE,
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True
-    )
+    assert _coerce_arguments('get_timeline', {'page': '3'}) == {'page': 3}
+    assert _coerce_arguments('get_timeline', {'page': 'next'}) == {'page': 'next'}
 
-    try:
-        # Send the request
-        stdout, stderr = proc.communicate(
-            input=json.dumps(request) + "\n",
-            timeout=10
-        )
+    unchanged = {'project_id': '1'}
+    assert _coerce_arguments('get_project', unchanged) is unchanged
 
-        # Parse the response
-        response = json.loads(stdout.strip())
 
-        # Check the error response
-        assert response["jsonrpc"] == "2.0"
-        assert response["id"] == 1
-        assert "error" in response
-        assert response["error"]["code"] == -32601  # Method not found
+def test_cli_server_reuses_search_helper():
+    """Test that the search helper is rebuilt only when the client changes."""
+    from mcp_server_cli import _get_search
 
-    finally:
-        if proc.poll() is None:
-            proc.terminate()
+    client = MagicMock()
+    search = _get_search(client)
+    assert search.client is client
+    assert _get_search(client) is search
+    assert _get_search(MagicMock()) is not search
+
+
+@patch('auth_manager.ensure_authenticated', return_value=True)
+@patch.object(token_storage, 'get_token')
+def test_cli_server_caches_read_only_tools(mock_get_token, mock_auth):
+    """Test that read-only tool results are cached and writes invalidate them."""
+    from mcp_server_cli import MCPServer
+
+    mock_get_token.return_value = {'access_token': 'test_token', 'account_id': '12345'}
+    server = MCPServer()
+    client, _ = server._get_basecamp_client()
+
+    with patch.object(client, 'get_projects', return_value=[{'id': 1}]) as mock_get_projects, \
+            patch.object(client, 'get_todolists', return_value=[]) as mock_get_todolists:
+        first = server._execute_tool('get_projects', {})
+        assert server._execute_tool('get_projects', {}) is first
+        assert mock_get_projects.call_count == 1
+
+        for project_id in ('1', '2'):
+            server._execute_tool('get_todolists', {'project_id': project_id})
+        with patch.object(client, 'delete_todo', return_value=True):
+            server._execute_tool('delete_todo', {'project_id': '1', 'todo_id': '2'})
+        for project_id in ('1', '2'):
+            server._execute_tool('get_todolists', {'project_id': project_id})
+        server._execute_tool('get_projects', {})
+
+        # Only the todolists of the project written to are fetched again
+        assert mock_get_todolists.call_count == 3
+        assert mock_get_projects.call_count == 1
+
+
+@patch('auth_manager.ensure_authenticated', return_value=False)
+@patch.object(token_storage, 'is_token_expired')
+@patch.object(token_storage, 'get_token')
+def test_cli_server_auth_errors(mock_get_token, mock_is_expired, mock_auth):
+    """Test that auth failures are reported without re-reading token storage."""
+    from mcp_server_cli import MCPServer
+
+    server = MCPServer()
+    mock_get_token.return_value = None
+    assert server._execute_tool('get_projects', {})['error'] == 'Authentication required'
+
+    mock_get_token.return_value = {'access_token': 'test_token', 'account_id': '12345'}
+    assert server._execute_tool('get_projects', {})['error'] == 'OAuth token expired'
+    mock_is_expired.assert_not_called()
+
+
+def test_cli_server_search_basecamp_runs_sub_queries():
+    """Test that search_basecamp collects every sub-query result."""
+    from mcp_server_cli import _tool_search_basecamp
+
+    search = MagicMock()
+    search.search_projects.return_value = ['project']
+    search.search_todos.return_value = ['todo']
+    search.search_messages.return_value = ['message']
+    with patch('mcp_server_cli._get_search', return_value=search):
+        result = _tool_search_basecamp(MagicMock(), {'query': 'x'})
+
+    assert result['results'] == {'projects': ['project'], 'todos': ['todo'], 'messages': ['message']}
+    search.search_todos.assert_called_once_with('x')
+
+
+@patch('auth_manager.ensure_authenticated', return_value=True)
+@patch.object(token_storage, 'get_token')
+def test_cli_server_token_expired_during_call(mock_get_token, mock_auth):
+    """Test that only TokenExpiredError is reported as an expired token."""
+    from basecamp_client import TokenExpiredError
+    from mcp_server_cli import MCPServer
+
+    mock_get_token.return_value = {'access_token': 'test_token', 'account_id': '12345'}
+    server = MCPServer()
+    client, _ = server._get_basecamp_client()
+
+    with patch.object(client, 'get_card', side_effect=Exception("Card '401 expired plan' failed")):
+        result = server._execute_tool('get_card', {'project_id': '1', 'card_id': '2'})
+    assert result['error'] == 'Execution error'
+
+    with patch.object(client, 'get_card', side_effect=TokenExpiredError("401 - expired")):
+        result = server._execute_tool('get_card', {'project_id': '1', 'card_id': '2'})
+    assert result['error'] == 'OAuth token expired'
+    assert server._cached_client is None
+
+    client, _ = server._get_basecamp_client()
+    with patch.object(client, 'get_card_table', side_effect=TokenExpiredError("401 - expired")):
+        result = server._execute_tool('get_card_table', {'project_id': '1'})
+    assert result['error'] == 'OAuth token expired'
+    assert server._cached_client is None
+
+
+def test_cli_server_max_pages_is_validated():
+    """Test that max_pages is clamped and non-integers are rejected."""
+    from basecamp_client import MAX_FETCH_PAGES
+    from mcp_server_cli import _coerce_arguments, _tool_get_timeline
+
+    client = MagicMock()
+    client.fetch_pages.return_value = []
+    _tool_get_timeline(client, _coerce_arguments('get_timeline', {'auto_paginate': 'true', 'max_pages': '300'}))
+    assert client.fetch_pages.call_args[0][2] == MAX_FETCH_PAGES
+
+    _tool_get_timeline(client, {'auto_paginate': True, 'max_pages': 0})
+    assert client.fetch_pages.call_args[0][2] == 1
+
+    with pytest.raises(ValueError):
+        _tool_get_timeline(client, _coerce_arguments('get_timeline', {'auto_paginate': True, 'max_pages': 'lots'}))
+
+
+@patch('auth_manager.ensure_authenticated', return_value=True)
+@patch.object(token_storage, 'get_token')
+def test_cli_server_uses_patched_module_attributes(mock_get_token, mock_auth):
+    """Test that patching mcp_server_cli.BasecampClient replaces the client class."""
+    from mcp_server_cli import MCPServer
+
+    mock_get_token.return_value = {'access_token': 'test_token', 'account_id': '12345'}
+    fake_client_class = MagicMock()
+    with patch('mcp_server_cli.BasecampClient', fake_client_class):
+        client, _ = MCPServer()._get_basecamp_client()
+    assert client is fake_client_class.return_value
@@ -1,7 +1,7 @@
 """Tests for compact_response module."""
 
 import pytest
-from compact_response import compact_item, compact_list, _extract_assignee_names, _extract_creator_name
+from compact_response import compact_item, compact_list, compact_lists, compact_iter, parse_fields
 
 
 # --- Sample data fixtures ---
@@ -215,37 +215,81 @@ class TestCompactList:
         assert compact_list("not a list", "card") == "not a list"
 
 
-# --- Helper function tests ---
+class TestCompactLists:
+    def test_matches_compact_list_per_list(self):
+        cards = [FULL_CARD, {"id": 2, "title": "Card 2", "completed": True}]
+        assert compact_lists((cards, [], cards[:1]), "card") == [
+            compact_list(cards, "card"), [], compact_list(cards[:1], "card")
+        ]
+
+    def test_non_list_entries_pass_through(self):
+        assert compact_lists((None, [FULL_TODO]), "todo")[0] is None
+
+
+class TestFieldSelection:
+    def test_parse_fields(self):
+        assert parse_fields(None) is None
+        assert parse_fields("") is None
+        assert parse_fields("id, title,") == frozenset({"id", "title"})
+
+    def test_narrows_compact_fields(self):
+        result = compact_item(FULL_CARD, "card", frozenset({"id", "title"}))
+        assert result == {"id": 123, "title": "Fix login bug"}
+
+    def test_cannot_request_fields_outside_compact_set(self):
+        result = compact_item(FULL_CARD, "card", frozenset({"id", "description"}))
+        assert result == {"id": 123}
+
+    def test_extension_fields_can_be_selected(self):
+        result = compact_list([FULL_CARD], "card", frozenset({"assignee_names"}))
+        assert list(result[0]) == ["assignee_names"]
+
+
+class TestCompactIter:
+    def test_matches_compact_list(self):
+        cards = [FULL_CARD, {"id": 2, "title": "Card 2", "completed": True}]
+        assert list(compact_iter(cards, "card")) == compact_list(cards, "card")
+
+    def test_is_lazy(self):
+        def items():
+            yield FULL_TODO
+            raise AssertionError("consumed past the first item")
+
+        assert next(compact_iter(items(), "todo"))["id"] == 456
+
+
+# --- Assignee and creator extraction ---
 
-class TestExtractAssigneeNames:
+class TestAssigneeNames:
     def test_multiple_assignees(self):
-        item = {"assignees": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]}
-        assert _extract_assignee_names(item) == ["A", "B"]
+        item = {"id": 1, "assignees": [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}]}
+        assert compact_item(item, "card")["assignee_names"] == ["A", "B"]
 
     def test_no_assignees_key(self):
-        assert _extract_assignee_names({"id": 1}) == []
+        assert "assignee_names" not in compact_item({"id": 1}, "card")
 
     def test_empty_assignees(self):
-        assert _extract_assignee_names({"assignees": []}) == []
+        assert "assignee_names" not in compact_item({"id": 1, "assignees": []}, "card")
 
     def test_assignee_without_name(self):
-        item = {"assignees": [{"id": 1}]}
-        assert _extract_assignee_names(item) == []
+        item = {"id": 1, "assignees": [{"id": 1}]}
+        assert "assignee_names" not in compact_item(item, "card")
 
     def test_assignees_not_list(self):
-        item = {"assignees": "invalid"}
-        assert _extract_assignee_names(item) == []
+        item = {"id": 1, "assignees": "invalid"}
+        assert compact_item(item, "card") == {"id": 1}
 
 
-class TestExtractCreatorName:
+class TestCreatorName:
     def test_creator_present(self):
-        assert _extract_creator_name({"creator": {"id": 1, "name": "Alice"}}) == "Alice"
+        item = {"id": 1, "creator": {"id": 1, "name": "Alice"}}
+        assert compact_item(item, "message")["creator_name"] == "Alice"
 
     def test_no_creator(self):
-        assert _extract_creator_name({"id": 1}) is None
+        assert "creator_name" not in compact_item({"id": 1}, "message")
 
     def test_creator_without_name(self):
-        assert _extract_creator_name({"creator": {"id": 1}}) is None
+        assert "creator_name" not in compact_item({"id": 1, "creator": {"id": 1}}, "message")
 
     def test_creator_not_dict(self):
-        assert _extract_creator_name({"creator": "invalid"}) is None
+        assert compact_item({"id": 1, "creator": "invalid"}, "message") == {"id": 1}